@@ -17,6 +17,18 @@ class Settings(BaseSettings):
     # Normalization settings
     use_zscore_normalization: bool = False  # Use min-max for stable scaling
     normalization_clip_range: Tuple[float, float] = (-2.0, 2.0)
+    concurrent_normalization: bool = False  # Normalize modalities in parallel threads; only pays off for large metric dicts
+    
+    # Video perception settings
+    video_refine_iris: bool = False  # Iris refinement model; only needed for gaze variance
+    video_pose_complexity: int = 0  # 0=lite, 1=full, 2=heavy
+    face_emotion_model_path: Optional[str] = None  # FER+ ONNX model; FER is used when unset
+    face_landmarker_model_path: Optional[str] = None  # MediaPipe Tasks .task bundle (e.g. INT8); legacy Face Mesh when unset
+    video_worker_processes: Optional[int] = None  # Video worker pool size; defaults to CPU count / web_concurrency
+    web_concurrency: int = 1  # Web server worker processes (uvicorn --workers reads the same WEB_CONCURRENCY env var)
+    
+    # Internal routes (POST /internal/analyze skips input validation); enable only behind a trusted network boundary
+    enable_internal_routes: bool = False
     
     # LLM Perception (OpenRouter)
     openrouter_api_key: Optional[str] = None
@@ -10,11 +10,15 @@ import time
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from app.config import settings
 from app.models.loader import model_registry
-from app.routes.analyze import router as analyze_router
+from app.routes.analyze import (
+    router as analyze_router,
+    internal_router,
+    shutdown_video_executor
+)
 from app.schemas import HealthResponse
 
 # Configure logging
@@ -58,6 +62,7 @@ async def lifespan(app: FastAPI):
     
     # Cleanup on shutdown
     logger.info("Shutting down AURA Perception Layer...")
+    shutdown_video_executor()
 
 
 # Create FastAPI application
@@ -77,7 +82,9 @@ app = FastAPI(
     All metrics are normalized using z-score or min-max scaling.
     """,
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # Responses are flat dicts of floats; orjson encodes them much faster than json
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -119,6 +126,9 @@ async def global_exception_handler(request: Request, exc: Exception):
 
 # Include routers
 app.include_router(analyze_router)
+if settings.enable_internal_routes:
+    # Unvalidated fast path; off unless only trusted services can reach the API
+    app.include_router(internal_router)
 
 
 @app.get("/", response_model=dict)
@@ -148,7 +158,7 @@ async def health_check():
         model_registry.sentiment_classifier is not None
     )
     
-    return HealthResponse(
+    return HealthResponse.model_construct(
         status="healthy" if models_loaded else "degraded",
         models_loaded=models_loaded,
         version="1.0.0"
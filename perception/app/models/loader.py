@@ -4,6 +4,7 @@ Models are cached globally and never reloaded during request handling.
 """
 
 import logging
+import threading
 from typing import Optional
 from sentence_transformers import SentenceTransformer
 from transformers import pipeline, AutoModelForSequenceClassification, AutoTokenizer
@@ -34,6 +35,13 @@ class ModelRegistry:
         self.sentiment_classifier = None
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
         
+        # Requests run text perception in worker threads, and HF pipelines and
+        # their fast tokenizers are not safe to call from two threads at once
+        # ("Already borrowed"); each model is used by one thread at a time
+        self._sentence_transformer_lock = threading.Lock()
+        self._emotion_lock = threading.Lock()
+        self._sentiment_lock = threading.Lock()
+        
         ModelRegistry._initialized = True
     
     def load_all_models(self):
@@ -93,25 +101,29 @@ class ModelRegistry:
         """Generate embedding for text using sentence-transformer."""
         if self.sentence_transformer is None:
             raise RuntimeError("SentenceTransformer not loaded")
-        return self.sentence_transformer.encode(text, convert_to_numpy=True)
+        with self._sentence_transformer_lock:
+            return self.sentence_transformer.encode(text, convert_to_numpy=True)
     
     def get_embeddings_batch(self, texts: list):
         """Generate embeddings for a batch of texts."""
         if self.sentence_transformer is None:
             raise RuntimeError("SentenceTransformer not loaded")
-        return self.sentence_transformer.encode(texts, convert_to_numpy=True)
+        with self._sentence_transformer_lock:
+            return self.sentence_transformer.encode(texts, convert_to_numpy=True)
     
     def get_emotions(self, text: str):
         """Get emotion probabilities for text."""
         if self.emotion_classifier is None:
             raise RuntimeError("Emotion classifier not loaded")
-        return self.emotion_classifier(text[:512])[0]
+        with self._emotion_lock:
+            return self.emotion_classifier(text[:512])[0]
     
     def get_sentiment(self, text: str):
         """Get sentiment scores for text."""
         if self.sentiment_classifier is None:
             raise RuntimeError("Sentiment classifier not loaded")
-        return self.sentiment_classifier(text[:512])[0]
+        with self._sentiment_lock:
+            return self.sentiment_classifier(text[:512])[0]
 
 
 # Global model registry instance
@@ -1,6 +1,22 @@
 # Perception Modules
-from app.perception.text_perception import TextPerception
-from app.perception.audio_perception import AudioPerception
-from app.perception.video_perception import VideoPerception
+# Exports are resolved on first access, so importing one submodule (such as
+# video_worker in a spawned video process) does not load the text and audio
+# model stacks (torch, transformers).
+import importlib
+
+_EXPORTS = {
+    "TextPerception": "app.perception.text_perception",
+    "AudioPerception": "app.perception.audio_perception",
+    "VideoPerception": "app.perception.video_perception",
+}
 
 __all__ = ["TextPerception", "AudioPerception", "VideoPerception"]
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,144 @@
+"""
+Face Emotion Model - Lightweight ONNX facial expression classifier.
+Runs an FER+ CNN (emotion-ferplus-8) through onnxruntime on face crops that
+MediaPipe has already localized, so no second face detector is needed.
+"""
+
+import os
+import cv2
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Try to import onnxruntime with fallback
+try:
+    import onnxruntime as ort
+    ORT_AVAILABLE = True
+except ImportError:
+    ort = None
+    ORT_AVAILABLE = False
+    logger.warning("onnxruntime not available, ONNX emotion model disabled")
+
+
+class FaceEmotionOnnx:
+    """
+    Classifies facial expressions from grayscale face crops.
+    Outputs probabilities over the caller's expression labels.
+    """
+
+    INPUT_SIZE = 64
+
+    # FER+ output classes, in model order
+    FERPLUS_LABELS = [
+        'neutral', 'happiness', 'surprise', 'sadness',
+        'anger', 'disgust', 'fear', 'contempt'
+    ]
+
+    # FER+ class -> expression label (contempt has no counterpart, folded into disgust)
+    FERPLUS_TO_EXPRESSION = {
+        'neutral': 'neutral',
+        'happiness': 'happy',
+        'surprise': 'surprise',
+        'sadness': 'sad',
+        'anger': 'angry',
+        'disgust': 'disgust',
+        'fear': 'fear',
+        'contempt': 'disgust'
+    }
+
+    def __init__(self, model_path: str, labels: List[str]):
+        """
+        Load the ONNX model.
+
+        Args:
+            model_path: Path to the FER+ ONNX model
+            labels: Expression labels to report, in output order
+        """
+        sess_options = ort.SessionOptions()
+        # Threading is handled by the frame pipeline, not inside the model
+        sess_options.intra_op_num_threads = 1
+        self.session = ort.InferenceSession(
+            model_path,
+            sess_options=sess_options,
+            providers=["CPUExecutionProvider"]
+        )
+        model_input = self.session.get_inputs()[0]
+        self.input_name = model_input.name
+        # The model zoo export pins the batch dimension to 1; re-exports may leave it dynamic
+        self.supports_batching = not isinstance(model_input.shape[0], int)
+        self.labels = list(labels)
+
+        # (8, n_labels) projection from FER+ probabilities onto our labels
+        self._projection = np.zeros((len(self.FERPLUS_LABELS), len(self.labels)), dtype=np.float32)
+        for i, ferplus_label in enumerate(self.FERPLUS_LABELS):
+            self._projection[i, self.labels.index(self.FERPLUS_TO_EXPRESSION[ferplus_label])] = 1.0
+
+    @classmethod
+    def load(cls, model_path: Optional[str], labels: List[str]) -> Optional["FaceEmotionOnnx"]:
+        """Load the model if onnxruntime and the model file are available, else None."""
+        if not model_path or not ORT_AVAILABLE:
+            return None
+        if not os.path.isfile(model_path):
+            logger.warning(f"ONNX emotion model not found at {model_path}")
+            return None
+
+        try:
+            model = cls(model_path, labels)
+            logger.info("ONNX emotion model loaded successfully")
+            return model
+        except Exception as e:
+            logger.warning(f"ONNX emotion model initialization failed: {e}")
+            return None
+
+    def preprocess(
+        self,
+        frame: np.ndarray,
+        face_box: Tuple[int, int, int, int]
+    ) -> Optional[np.ndarray]:
+        """Crop the (x0, y0, x1, y1) face box from a BGR frame as a 64x64 float32 grayscale image."""
+        x0, y0, x1, y1 = face_box
+        crop = frame[y0:y1, x0:x1]
+        if crop.size == 0:
+            return None
+
+        gray = cv2.cvtColor(crop, cv2.COLOR_BGR2GRAY)
+        resized = cv2.resize(
+            gray, (self.INPUT_SIZE, self.INPUT_SIZE), interpolation=cv2.INTER_AREA
+        )
+        return resized.astype(np.float32)
+
+    def predict(self, crop: np.ndarray) -> Dict[str, float]:
+        """Classify one preprocessed crop into expression probabilities."""
+        return self.predict_batch(crop[np.newaxis])[0]
+
+    def predict_batch(self, crops: np.ndarray) -> List[Dict[str, float]]:
+        """Classify an (N, 64, 64) stack of preprocessed crops into per-crop dicts."""
+        probabilities = self.predict_proba(crops)
+        return [dict(zip(self.labels, row)) for row in probabilities.tolist()]
+
+    def predict_proba(self, crops: np.ndarray) -> np.ndarray:
+        """
+        Classify an (N, 64, 64) stack of preprocessed crops in one session run.
+        Returns an (N, n_labels) float32 array in label order.
+        Falls back to per-crop runs when the model has a fixed batch size.
+        """
+        batch = crops[:, np.newaxis].astype(np.float32, copy=False)
+
+        if self.supports_batching:
+            logits = self.session.run(None, {self.input_name: batch})[0]
+        else:
+            logits = np.concatenate([
+                self.session.run(None, {self.input_name: batch[i:i + 1]})[0]
+                for i in range(len(batch))
+            ])
+
+        return self._to_label_probabilities(logits).astype(np.float32, copy=False)
+
+    def _to_label_probabilities(self, logits: np.ndarray) -> np.ndarray:
+        """Softmax (N, 8) FER+ logits and project onto (N, n_labels)."""
+        shifted = logits - logits.max(axis=1, keepdims=True)
+        exp = np.exp(shifted)
+        probabilities = exp / exp.sum(axis=1, keepdims=True)
+        return probabilities @ self._projection
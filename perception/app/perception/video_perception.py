@@ -1,15 +1,21 @@
 """
 Video Perception Layer - Extracts numerical features from video/image signals.
-Uses MediaPipe for face landmarks and gaze, FER for expression classification.
+Uses MediaPipe for face landmarks and gaze, an ONNX FER+ model (or FER as a
+fallback) for expression classification.
 All metrics are computed over temporal windows and aggregated statistically.
 """
 
 import io
 import cv2
 import numpy as np
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Optional, List, Tuple, Iterable, Iterator
 from dataclasses import dataclass
 import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from app.perception.face_emotion import FaceEmotionOnnx
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +35,84 @@ except ImportError:
     mp = None
     logger.warning("MediaPipe not available, video analysis disabled")
 
+# Try to import MediaPipe Tasks for FaceLandmarker (.task model bundles)
+try:
+    from mediapipe.tasks.python import BaseOptions as MpBaseOptions
+    from mediapipe.tasks.python import vision as mp_vision
+    MP_TASKS_AVAILABLE = True
+except ImportError:
+    MP_TASKS_AVAILABLE = False
+
+# Try to import PyAV for in-memory video decoding
+try:
+    import av
+    AV_AVAILABLE = True
+except ImportError:
+    av = None
+    AV_AVAILABLE = False
+    logger.info("PyAV not available, decoding video through OpenCV temp files")
+
+# Try to import numba for JIT-compiled scalar scans
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logger.info("numba not available, using NumPy reductions")
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _count_turns(yaw: np.ndarray, threshold: float) -> int:
+        """Count frame-to-frame yaw changes larger than threshold."""
+        count = 0
+        for i in range(1, yaw.shape[0]):
+            if abs(yaw[i] - yaw[i - 1]) > threshold:
+                count += 1
+        return count
+else:
+    def _count_turns(yaw: np.ndarray, threshold: float) -> int:
+        """Count frame-to-frame yaw changes larger than threshold."""
+        return int(np.count_nonzero(np.abs(np.diff(yaw)) > threshold))
+
+
+# Sentinel marking the end of a pipeline stage's output
+_STAGE_DONE = object()
+
+
+def _put_until_stopped(q: "queue.Queue", item: Any, stop: threading.Event) -> bool:
+    """Put onto a bounded queue, giving up if the pipeline is being torn down."""
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _get_until_stopped(q: "queue.Queue", stop: threading.Event) -> Any:
+    """Get from a pipeline queue, returning the end sentinel once the pipeline stops."""
+    while not stop.is_set():
+        try:
+            return q.get(timeout=0.1)
+        except queue.Empty:
+            continue
+    return _STAGE_DONE
+
+
+def _landmarks_to_np(landmark_list) -> np.ndarray:
+    """
+    Copy normalized MediaPipe landmarks (Face Mesh, Pose, or a Tasks landmark
+    list) into one (N, 3) array of (x, y, z), so each field is read exactly
+    once per frame.
+    """
+    landmarks = getattr(landmark_list, 'landmark', landmark_list)
+    return np.array(
+        [(lm.x, lm.y, lm.z) for lm in landmarks],
+        dtype=np.float32
+    )
+
 
 @dataclass
 class VideoMetrics:
@@ -74,6 +158,130 @@ class VideoMetrics:
         }
 
 
+class RunningMoments:
+    """
+    Streaming mean and population variance per column (Welford's algorithm,
+    with Chan's update for merging a batch of rows at once).
+    Memory is O(width) regardless of how many rows are seen.
+    """
+    
+    def __init__(self, width: int = 1):
+        self.count = 0
+        self.mean = np.zeros(width, dtype=np.float64)
+        self.m2 = np.zeros(width, dtype=np.float64)
+    
+    def update(self, values: np.ndarray):
+        """Merge a (k, width) batch of rows, or a single (width,) row."""
+        values = np.asarray(values, dtype=np.float64).reshape(-1, self.mean.shape[0])
+        n = values.shape[0]
+        if n == 0:
+            return
+        
+        batch_mean = values.mean(axis=0)
+        batch_m2 = ((values - batch_mean) ** 2).sum(axis=0)
+        
+        total = self.count + n
+        delta = batch_mean - self.mean
+        self.mean += delta * (n / total)
+        self.m2 += batch_m2 + delta ** 2 * (self.count * n / total)
+        self.count = total
+    
+    @property
+    def variance(self) -> np.ndarray:
+        """Population variance per column (zeros before any update)."""
+        if self.count == 0:
+            return np.zeros_like(self.m2)
+        return self.m2 / self.count
+
+
+@dataclass
+class FramesSoA:
+    """
+    Per-frame features stored as one NumPy array per field (struct of arrays).
+    Row i holds frame i; missing values are NaN with the matching mask False.
+    
+    Features whose aggregates are order-independent moments (gaze offset,
+    expression probabilities) are not stored per frame; they are folded into
+    running accumulators as frames arrive.
+    """
+    # Face
+    has_face: np.ndarray            # (N,) bool
+    eye_contact: np.ndarray         # (N,) bool
+    head_pose: np.ndarray           # (N, 3) float32 yaw, pitch, roll in degrees
+    
+    # Body (normalized coordinates unless noted)
+    has_body: np.ndarray            # (N,) bool
+    shoulder_width: np.ndarray      # (N,) float32
+    shoulder_center: np.ndarray     # (N, 3) float32 x, y, z
+    wrist_positions: np.ndarray     # (N, 2, 2) float32 left/right (x, y) in pixels
+    elbow_positions: np.ndarray     # (N, 2, 2) float32 left/right (x, y)
+    nose_position: np.ndarray       # (N, 3) float32 x, y, z
+    hip_center: np.ndarray          # (N, 2) float32 x, y
+    
+    # Streaming accumulators
+    gaze_stats: RunningMoments      # horizontal iris offset
+    emotion_stats: RunningMoments   # expression probabilities, one column per label
+    mismatch_stats: RunningMoments  # per-frame emotion mismatch
+    
+    @classmethod
+    def allocate(cls, n_frames: int, n_labels: int) -> "FramesSoA":
+        """Preallocate storage for n_frames frames with no detections."""
+        def empty(*shape):
+            return np.full((n_frames,) + shape, np.nan, dtype=np.float32)
+        
+        return cls(
+            has_face=np.zeros(n_frames, dtype=bool),
+            eye_contact=np.zeros(n_frames, dtype=bool),
+            head_pose=empty(3),
+            has_body=np.zeros(n_frames, dtype=bool),
+            shoulder_width=empty(),
+            shoulder_center=empty(3),
+            wrist_positions=empty(2, 2),
+            elbow_positions=empty(2, 2),
+            nose_position=empty(3),
+            hip_center=empty(2),
+            gaze_stats=RunningMoments(),
+            emotion_stats=RunningMoments(n_labels),
+            mismatch_stats=RunningMoments()
+        )
+    
+    def __len__(self) -> int:
+        return len(self.has_face)
+    
+    def ensure_capacity(self, n_frames: int) -> "FramesSoA":
+        """Grow every array (doubling) so that at least n_frames rows exist."""
+        capacity = len(self)
+        if n_frames <= capacity:
+            return self
+        new_capacity = max(n_frames, 2 * capacity, 16)
+        grown = FramesSoA.allocate(new_capacity, self.emotion_stats.mean.shape[0])
+        for name, array in vars(self).items():
+            if isinstance(array, np.ndarray):
+                getattr(grown, name)[:capacity] = array
+                setattr(self, name, getattr(grown, name))
+        return self
+    
+    def truncate(self, n_frames: int) -> "FramesSoA":
+        """Drop unused trailing rows (views, no copy)."""
+        for name, array in list(vars(self).items()):
+            if isinstance(array, np.ndarray):
+                setattr(self, name, array[:n_frames])
+        return self
+
+
+@dataclass
+class _FramePlan:
+    """
+    Per-resolution constants for the frame pipeline, built once per source
+    frame size and reused by every later frame and call with that size.
+    """
+    dsize: Optional[Tuple[int, int]]    # (width, height) to resize to; None keeps the frame
+    shape: Tuple[int, int]              # analyzed (height, width)
+    pixel_scale: np.ndarray             # (2,) float64 (width, height) for normalized -> pixels
+    source_scale: np.ndarray            # (2,) float64 source (width, height), before downscaling
+    camera_matrix: np.ndarray           # (3, 3) pinhole camera for the analyzed size
+
+
 class VideoPerception:
     """
     Extracts numerical features from video without making judgments.
@@ -86,6 +294,7 @@ class VideoPerception:
     
     # Expression labels
     EXPRESSION_LABELS = ['angry', 'disgust', 'fear', 'happy', 'sad', 'surprise', 'neutral']
+    EXPRESSION_LABEL_INDEX = {label: i for i, label in enumerate(EXPRESSION_LABELS)}
     
     # MediaPipe Pose landmark indices
     POSE_NOSE = 0
@@ -98,69 +307,187 @@ class VideoPerception:
     POSE_LEFT_HIP = 23
     POSE_RIGHT_HIP = 24
     
-    def __init__(self):
+    # Default sampling rate for video analysis; metrics are statistical so
+    # analyzing every frame of a 30 FPS clip adds cost without adding signal
+    DEFAULT_ANALYSIS_FPS = 5.0
+    
+    # Frame rate the per-step motion thresholds (head turn, gesture) were tuned
+    # at, on consecutive frames; sampled steps are scaled to this many frames
+    CALIBRATION_FPS = 30.0
+    
+    # Long-side cap for frames fed to Face Mesh/FER; landmark-derived metrics are
+    # resolution invariant above ~480p while detector cost scales with pixel count
+    MAX_FRAME_SIDE = 480
+    
+    # Frames buffered between pipeline stages
+    PIPELINE_PREFETCH = 4
+    
+    # Face crops per ONNX emotion model call; CPU kernels amortize poorly at batch size 1
+    EMOTION_BATCH_SIZE = 16
+    
+    def __init__(
+        self,
+        pose_complexity: int = 0,
+        refine_iris: bool = False,
+        emotion_model_path: Optional[str] = None,
+        face_landmarker_model_path: Optional[str] = None
+    ):
+        """
+        Initialize detectors.
+        
+        Args:
+            pose_complexity: MediaPipe Pose model complexity (0=lite, 1=full, 2=heavy).
+                The lite model is ~2x faster and sufficient for shoulder/wrist/elbow tracking.
+            refine_iris: Run the Face Mesh iris refinement model. Iris landmarks are only
+                used for gaze variance, which is skipped entirely when disabled.
+            emotion_model_path: Optional FER+ ONNX model classifying the face crops
+                localized by Face Mesh. Falls back to FER when absent.
+            face_landmarker_model_path: Optional MediaPipe Tasks FaceLandmarker bundle
+                (e.g. an INT8-quantized face_landmarker.task) used in place of the
+                legacy Face Mesh solution. The bundle always includes iris landmarks.
+        """
+        self.pose_complexity = pose_complexity
+        self.refine_iris = refine_iris
+        
         # Initialize MediaPipe Face Mesh if available
         self.mp_face_mesh = None
         self.face_mesh = None
+        self.face_landmarker = None
+        self._landmarker_timestamp_ms = 0
         self.mp_pose = None
         self.pose = None
+        self._pose_executor: Optional[ThreadPoolExecutor] = None
         
-        if MP_AVAILABLE and mp is not None:
+        # The instance is shared across concurrent requests, but MediaPipe graphs are
+        # not thread-safe. Face Mesh calls are serialized by this lock; Pose calls
+        # by its single-worker executor.
+        self._face_mesh_lock = threading.Lock()
+        
+        # Prefer the Tasks FaceLandmarker when a model bundle is configured
+        if face_landmarker_model_path and MP_TASKS_AVAILABLE:
             try:
-                self.mp_face_mesh = mp.solutions.face_mesh
-                self.face_mesh = self.mp_face_mesh.FaceMesh(
-                    max_num_faces=1,
-                    refine_landmarks=True,
-                    min_detection_confidence=0.5,
-                    min_tracking_confidence=0.5
+                self.face_landmarker = mp_vision.FaceLandmarker.create_from_options(
+                    mp_vision.FaceLandmarkerOptions(
+                        base_options=MpBaseOptions(model_asset_path=face_landmarker_model_path),
+                        running_mode=mp_vision.RunningMode.VIDEO,
+                        num_faces=1,
+                        min_face_detection_confidence=0.5,
+                        min_tracking_confidence=0.5
+                    )
                 )
-                logger.info("MediaPipe Face Mesh initialized successfully")
+                logger.info("MediaPipe FaceLandmarker initialized successfully")
+            except Exception as e:
+                logger.warning(f"MediaPipe FaceLandmarker initialization failed, using Face Mesh: {e}")
+        
+        if MP_AVAILABLE and mp is not None:
+            try:
+                if self.face_landmarker is None:
+                    self.mp_face_mesh = mp.solutions.face_mesh
+                    self.face_mesh = self.mp_face_mesh.FaceMesh(
+                        max_num_faces=1,
+                        refine_landmarks=refine_iris,
+                        min_detection_confidence=0.5,
+                        min_tracking_confidence=0.5
+                    )
+                    logger.info("MediaPipe Face Mesh initialized successfully")
                 
                 # Initialize MediaPipe Pose for body language detection
                 self.mp_pose = mp.solutions.pose
                 self.pose = self.mp_pose.Pose(
                     min_detection_confidence=0.5,
                     min_tracking_confidence=0.5,
-                    model_complexity=1  # 0=lite, 1=full, 2=heavy
+                    model_complexity=pose_complexity  # 0=lite, 1=full, 2=heavy
                 )
                 logger.info("MediaPipe Pose initialized successfully")
+                
+                # Single worker keeps the stateful Pose graph on one thread at a time,
+                # including across concurrent requests
+                self._pose_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="video-pose"
+                )
             except Exception as e:
                 logger.warning(f"MediaPipe initialization failed: {e}")
         
-        # Try to load FER for expression detection
+        # Whether face landmarks (and so face boxes) come from MediaPipe
+        self._has_face_tracker = self.face_mesh is not None or self.face_landmarker is not None
+        
+        # Prefer the ONNX emotion model on Face Mesh crops; it needs no face detector
+        self.emotion_model = None
+        if self._has_face_tracker:
+            self.emotion_model = FaceEmotionOnnx.load(emotion_model_path, self.EXPRESSION_LABELS)
+        
+        # Try to load FER for expression detection when the ONNX model is unavailable
         self.fer_detector = None
-        try:
-            from fer import FER
-            self.fer_detector = FER(mtcnn=True)
-            logger.info("FER emotion detector loaded successfully")
-        except ImportError:
-            logger.warning("FER not available, expression detection disabled")
-        except Exception as e:
-            logger.warning(f"FER initialization failed: {e}")
+        if self.emotion_model is None:
+            try:
+                from fer import FER
+                # Face Mesh supplies face boxes; MTCNN is only needed without it
+                self.fer_detector = FER(mtcnn=not self._has_face_tracker)
+                logger.info("FER emotion detector loaded successfully")
+            except ImportError:
+                logger.warning("FER not available, expression detection disabled")
+            except Exception as e:
+                logger.warning(f"FER initialization failed: {e}")
         
-        # Landmark indices for gaze estimation
-        self.LEFT_EYE_INDICES = [33, 133, 160, 159, 158, 144, 145, 153]
-        self.RIGHT_EYE_INDICES = [362, 263, 387, 386, 385, 373, 374, 380]
-        self.LEFT_IRIS_INDICES = [468, 469, 470, 471, 472]
-        self.RIGHT_IRIS_INDICES = [473, 474, 475, 476, 477]
+        # Landmark indices for gaze estimation (int arrays so lookups are direct NumPy gathers)
+        self.LEFT_EYE_INDICES = np.array([33, 133, 160, 159, 158, 144, 145, 153], dtype=np.int32)
+        self.RIGHT_EYE_INDICES = np.array([362, 263, 387, 386, 385, 373, 374, 380], dtype=np.int32)
+        self.LEFT_IRIS_INDICES = np.array([468, 469, 470, 471, 472], dtype=np.int32)
+        self.RIGHT_IRIS_INDICES = np.array([473, 474, 475, 476, 477], dtype=np.int32)
         
         # Face oval for head pose
-        self.FACE_OVAL_INDICES = [10, 338, 297, 332, 284, 251, 389, 356, 454, 323, 
-                                   361, 288, 397, 365, 379, 378, 400, 377, 152, 148,
-                                   176, 149, 150, 136, 172, 58, 132, 93, 234, 127,
-                                   162, 21, 54, 103, 67, 109]
+        self.FACE_OVAL_INDICES = np.array([10, 338, 297, 332, 284, 251, 389, 356, 454, 323,
+                                           361, 288, 397, 365, 379, 378, 400, 377, 152, 148,
+                                           176, 149, 150, 136, 172, 58, 132, 93, 234, 127,
+                                           162, 21, 54, 103, 67, 109], dtype=np.int32)
+        
+        # Landmarks matching the 3D head model: nose tip, chin, eye corners, mouth corners
+        self._POSE_LM_IDX = np.array([1, 152, 33, 263, 61, 291], dtype=np.int32)
+        
+        # Body landmark rows for (left, right) pairs
+        self._POSE_WRIST_IDX = np.array([self.POSE_LEFT_WRIST, self.POSE_RIGHT_WRIST], dtype=np.int32)
+        self._POSE_ELBOW_IDX = np.array([self.POSE_LEFT_ELBOW, self.POSE_RIGHT_ELBOW], dtype=np.int32)
+        
+        # Expression columns for the emotion mismatch score
+        self._POSITIVE_EXPRESSION_IDX = np.array(
+            [self.EXPRESSION_LABEL_INDEX[label] for label in ('happy', 'surprise')], dtype=np.int32
+        )
+        self._NEGATIVE_EXPRESSION_IDX = np.array(
+            [self.EXPRESSION_LABEL_INDEX[label] for label in ('angry', 'sad', 'fear')], dtype=np.int32
+        )
+        
+        # 3D model points for head pose estimation, matching _POSE_LM_IDX
+        self._model_points = np.array([
+            (0.0, 0.0, 0.0),          # Nose tip
+            (0.0, -330.0, -65.0),     # Chin
+            (-225.0, 170.0, -135.0),  # Left eye left corner
+            (225.0, 170.0, -135.0),   # Right eye right corner
+            (-150.0, -150.0, -125.0), # Left mouth corner
+            (150.0, -150.0, -125.0)   # Right mouth corner
+        ], dtype=np.float64)
+        
+        # Frame plans (resize target, camera matrix) keyed by source (width, height);
+        # the camera model assumes no lens distortion
+        self._frame_plan_cache: Dict[Tuple[int, int], _FramePlan] = {}
+        self._dist_coeffs = np.zeros((4, 1))
     
     def extract_metrics(
         self,
         video_data: bytes,
-        fps: float = 30.0
+        fps: float = 30.0,
+        include_body: bool = True,
+        target_fps: Optional[float] = DEFAULT_ANALYSIS_FPS
     ) -> VideoMetrics:
         """
         Extract all video metrics from raw video bytes.
         
         Args:
             video_data: Raw video bytes
-            fps: Frames per second for temporal analysis
+            fps: Frames per second of the source video
+            include_body: Run Pose detection for body language metrics.
+                Callers needing only gaze/expression can skip the Pose cost.
+            target_fps: Rate at which frames are sampled for analysis. Skipped
+                frames are never retrieved into arrays. None analyzes every frame.
             
         Returns:
             VideoMetrics containing all extracted features
@@ -168,23 +495,25 @@ class VideoPerception:
         metrics = VideoMetrics()
         
         try:
-            frames = self._decode_video(video_data)
+            stride = self._sampling_stride(fps, target_fps)
             
-            if not frames:
-                logger.warning("No frames extracted from video")
-                return metrics
-            
-            # Process all frames
-            frame_data = self._process_frames(frames)
+            # Frames are decoded lazily, so only the pipeline's prefetch window is resident
+            frames = self._iter_video_frames(video_data, stride)
+            frame_data = self._process_frames(frames, include_body)
             
             if not frame_data:
+                logger.warning("No frames extracted from video")
                 return metrics
             
+            # Temporal metrics are computed over the sampled sequence
+            fps = fps / stride
+            
             # Aggregate metrics from frame data
             self._aggregate_gaze_metrics(metrics, frame_data)
             self._aggregate_expression_metrics(metrics, frame_data)
             self._calculate_head_turn_frequency(metrics, frame_data, fps)
-            self._aggregate_body_language_metrics(metrics, frame_data, fps)
+            if include_body:
+                self._aggregate_body_language_metrics(metrics, frame_data, fps)
             
         except Exception as e:
             logger.error(f"Video processing error: {e}")
@@ -194,7 +523,8 @@ class VideoPerception:
     def extract_metrics_from_frames(
         self,
         frames: List[np.ndarray],
-        fps: float = 30.0
+        fps: float = 30.0,
+        include_body: bool = True
     ) -> VideoMetrics:
         """
         Extract metrics from a list of frame arrays.
@@ -202,6 +532,7 @@ class VideoPerception:
         Args:
             frames: List of BGR frame arrays
             fps: Frames per second
+            include_body: Run Pose detection for body language metrics
             
         Returns:
             VideoMetrics with aggregated statistics
@@ -212,25 +543,31 @@ class VideoPerception:
             return metrics
         
         try:
-            frame_data = self._process_frames(frames)
+            frame_data = self._process_frames(frames, include_body)
             
             if frame_data:
                 self._aggregate_gaze_metrics(metrics, frame_data)
                 self._aggregate_expression_metrics(metrics, frame_data)
                 self._calculate_head_turn_frequency(metrics, frame_data, fps)
-                self._aggregate_body_language_metrics(metrics, frame_data, fps)
+                if include_body:
+                    self._aggregate_body_language_metrics(metrics, frame_data, fps)
                 
         except Exception as e:
             logger.error(f"Frame processing error: {e}")
         
         return metrics
     
-    def extract_metrics_from_image(self, image_data: bytes) -> VideoMetrics:
+    def extract_metrics_from_image(
+        self,
+        image_data: bytes,
+        include_body: bool = True
+    ) -> VideoMetrics:
         """
         Extract metrics from a single image.
         
         Args:
             image_data: Raw image bytes
+            include_body: Run Pose detection for body language metrics
             
         Returns:
             VideoMetrics for the single frame
@@ -244,27 +581,68 @@ class VideoPerception:
             if frame is None:
                 return metrics
             
-            frame_data = self._process_frames([frame])
+            frame_data = self._process_frames([frame], include_body)
             
             if frame_data:
                 self._aggregate_gaze_metrics(metrics, frame_data)
                 self._aggregate_expression_metrics(metrics, frame_data)
-                self._aggregate_body_language_metrics(metrics, frame_data, fps=1.0)
+                if include_body:
+                    self._aggregate_body_language_metrics(metrics, frame_data, fps=1.0)
                 
         except Exception as e:
             logger.error(f"Image processing error: {e}")
         
         return metrics
     
-    def _decode_video(self, video_data: bytes) -> List[np.ndarray]:
-        """Decode video bytes into frames."""
-        frames = []
+    @staticmethod
+    def _sampling_stride(fps: float, target_fps: Optional[float]) -> int:
+        """Number of source frames per analyzed frame when sampling at target_fps."""
+        if target_fps and target_fps > 0:
+            return max(1, round(fps / target_fps))
+        return 1
+    
+    def _iter_video_frames(self, video_data: bytes, stride: int = 1) -> Iterator[np.ndarray]:
+        """
+        Lazily decode video bytes, yielding every stride-th frame as BGR.
+        
+        Decodes in memory with PyAV when available, otherwise through an
+        OpenCV temp file.
+        """
+        if AV_AVAILABLE:
+            return self._iter_video_frames_av(video_data, stride)
+        return self._iter_video_frames_cv2(video_data, stride)
+    
+    def _iter_video_frames_av(self, video_data: bytes, stride: int = 1) -> Iterator[np.ndarray]:
+        """
+        Demux and decode straight from the in-memory bytes with PyAV.
+        
+        Every frame must still be decoded (inter frames depend on their
+        predecessors), but only sampled frames are converted to BGR arrays.
+        """
+        try:
+            # BytesIO over an immutable bytes object shares its buffer (no copy);
+            # a memoryview or bytearray would be copied in
+            with av.open(io.BytesIO(video_data), mode='r') as container:
+                stream = container.streams.video[0]
+                # Frame- and slice-level decoder threads, managed by FFmpeg
+                stream.thread_type = 'AUTO'
+                
+                for index, frame in enumerate(container.decode(stream)):
+                    if index % stride == 0:
+                        yield frame.to_ndarray(format='bgr24')
+                
+        except Exception as e:
+            logger.error(f"Video decoding failed: {e}")
+    
+    def _iter_video_frames_cv2(self, video_data: bytes, stride: int = 1) -> Iterator[np.ndarray]:
+        """
+        Decode through a temp file with OpenCV.
         
+        Uses grab()/retrieve() so frames between samples are advanced past
+        without being converted to BGR or copied into arrays.
+        """
         try:
             # Write to temporary buffer and read with OpenCV
-            nparr = np.frombuffer(video_data, np.uint8)
-            
-            # Try to decode as video
             import tempfile
             with tempfile.NamedTemporaryFile(suffix='.mp4', delete=True) as tmp:
                 tmp.write(video_data)
@@ -272,186 +650,437 @@ class VideoPerception:
                 
                 cap = cv2.VideoCapture(tmp.name)
                 
-                while cap.isOpened():
-                    ret, frame = cap.read()
-                    if not ret:
-                        break
-                    frames.append(frame)
-                
-                cap.release()
+                try:
+                    index = 0
+                    while cap.grab():
+                        if index % stride == 0:
+                            ret, frame = cap.retrieve()
+                            if not ret:
+                                break
+                            yield frame
+                        index += 1
+                finally:
+                    cap.release()
                 
         except Exception as e:
             logger.error(f"Video decoding failed: {e}")
+    
+    def _process_frames(
+        self,
+        frames: Iterable[np.ndarray],
+        include_body: bool = True
+    ) -> FramesSoA:
+        """
+        Process frames and extract per-frame features including body language.
+        
+        Runs a three-stage pipeline connected by bounded queues: a decoder thread
+        pulls frames from the input, a landmark thread runs Face Mesh/Pose, and the
+        calling thread runs FER. While Face Mesh works on frame N the decoder
+        prepares N+1 and FER handles N-1. Each stage has a single worker because
+        the detectors are stateful and not thread-safe.
+        
+        Results are written by index into a FramesSoA, sized up front when the
+        frame count is known and grown on demand for lazily decoded video.
+        """
+        n_known = len(frames) if isinstance(frames, (list, tuple)) else 0
+        frame_data = FramesSoA.allocate(n_known, len(self.EXPRESSION_LABELS))
+        emotion_batch: List[Tuple[int, np.ndarray]] = []
         
-        return frames
-    
-    def _process_frames(self, frames: List[np.ndarray]) -> List[Dict[str, Any]]:
-        """Process frames and extract per-frame features including body language."""
-        frame_data = []
-        
-        for frame in frames:
-            data = {
-                'has_face': False,
-                'eye_contact': False,
-                'head_pose': None,
-                'gaze_direction': None,
-                'expressions': None,
-                # Body language data
-                'has_body': False,
-                'pose_landmarks': None,
-                'shoulder_width': None,
-                'wrist_positions': None,
-                'shoulder_center': None,
-                'nose_position': None,
-                'hip_center': None,
-                'elbow_positions': None
-            }
+        if isinstance(frames, (list, tuple)) and len(frames) < 2:
+            # Not worth spinning up pipeline threads for a single image
+            for index, frame in enumerate(frames):
+                plan = self._frame_plan(frame)
+                frame = self._downscale(frame, plan)
+                data = self._analyze_frame(frame, include_body, plan=plan)
+                self._expression_stage(frame_data, index, frame, data, emotion_batch)
+            if emotion_batch:
+                self._classify_emotion_batch(frame_data, emotion_batch)
+            return frame_data
+        
+        decoded: "queue.Queue" = queue.Queue(maxsize=self.PIPELINE_PREFETCH)
+        analyzed: "queue.Queue" = queue.Queue(maxsize=self.PIPELINE_PREFETCH)
+        stop = threading.Event()
+        
+        def decode_stage():
+            try:
+                for index, frame in enumerate(frames):
+                    plan = self._frame_plan(frame)
+                    frame = self._downscale(frame, plan)
+                    if not _put_until_stopped(decoded, (index, frame, plan), stop):
+                        return
+            except Exception as e:
+                logger.error(f"Frame decoding stage failed: {e}")
+            finally:
+                _put_until_stopped(decoded, _STAGE_DONE, stop)
+        
+        def landmark_stage():
+            # One RGB buffer cycled across frames instead of a fresh array per frame
+            rgb_buffer = None
+            try:
+                while True:
+                    item = _get_until_stopped(decoded, stop)
+                    if item is _STAGE_DONE:
+                        return
+                    index, frame, plan = item
+                    rgb_buffer = self._rgb_buffer_for(frame, rgb_buffer)
+                    data = self._analyze_frame(frame, include_body, rgb_buffer, plan)
+                    if not _put_until_stopped(analyzed, (index, frame, data), stop):
+                        return
+            except Exception as e:
+                logger.error(f"Landmark stage failed: {e}")
+            finally:
+                _put_until_stopped(analyzed, _STAGE_DONE, stop)
+        
+        workers = [
+            threading.Thread(target=decode_stage, name="video-decode", daemon=True),
+            threading.Thread(target=landmark_stage, name="video-landmarks", daemon=True),
+        ]
+        for worker in workers:
+            worker.start()
+        
+        n_frames = 0
+        try:
+            # Expression stage runs on the calling thread, the only writer of frame_data
+            while True:
+                item = analyzed.get()
+                if item is _STAGE_DONE:
+                    break
+                index, frame, data = item
+                n_frames = max(n_frames, index + 1)
+                self._expression_stage(frame_data, index, frame, data, emotion_batch)
             
-            # Convert BGR to RGB for MediaPipe
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            h, w = frame.shape[:2]
+            if emotion_batch:
+                self._classify_emotion_batch(frame_data, emotion_batch)
+        finally:
+            # Producers poll the stop flag, so they exit even if blocked on a full queue
+            stop.set()
+            for worker in workers:
+                worker.join()
+        
+        return frame_data.truncate(n_frames)
+    
+    def _expression_stage(
+        self,
+        frame_data: FramesSoA,
+        index: int,
+        frame: np.ndarray,
+        data: Dict[str, Any],
+        emotion_batch: List[Tuple[int, np.ndarray]]
+    ):
+        """Store a landmark-stage result and classify its expression (expression stage)."""
+        frame_data.ensure_capacity(index + 1)
+        
+        if self.emotion_model is None:
+            self._detect_expressions(frame, data)
+            self._store_frame(frame_data, index, data)
+            return
+        
+        self._store_frame(frame_data, index, data)
+        
+        # Accumulate face crops so the ONNX model runs on whole batches
+        crop = self._emotion_crop(frame, data)
+        if crop is not None:
+            emotion_batch.append((index, crop))
+        if len(emotion_batch) >= self.EMOTION_BATCH_SIZE:
+            self._classify_emotion_batch(frame_data, emotion_batch)
+            emotion_batch.clear()
+    
+    def _accumulate_expressions(self, frame_data: FramesSoA, probabilities: np.ndarray):
+        """Fold a (k, n_labels) block of expression probabilities into the running stats."""
+        frame_data.emotion_stats.update(probabilities)
+        
+        # Emotion mismatch: high when positive and negative expressions are both strong
+        positive = probabilities[:, self._POSITIVE_EXPRESSION_IDX].sum(axis=1)
+        negative = probabilities[:, self._NEGATIVE_EXPRESSION_IDX].sum(axis=1)
+        frame_data.mismatch_stats.update(np.minimum(positive, negative) * 2)
+    
+    def _store_frame(self, frame_data: FramesSoA, index: int, data: Dict[str, Any]):
+        """Copy one frame's features from the landmark-stage dict into row index."""
+        frame_data.has_face[index] = data['has_face']
+        frame_data.eye_contact[index] = data['eye_contact']
+        if data['head_pose'] is not None:
+            frame_data.head_pose[index] = data['head_pose']
+        if data['gaze_direction'] is not None:
+            frame_data.gaze_stats.update(data['gaze_direction'][0])
+        
+        expressions = data['expressions']
+        if expressions is not None:
+            # Labels missing from a frame count as 0
+            label_idx = self.EXPRESSION_LABEL_INDEX
+            row = np.zeros(len(self.EXPRESSION_LABELS), dtype=np.float64)
+            for label, score in expressions.items():
+                col = label_idx.get(label)
+                if col is not None:
+                    row[col] = score
+            self._accumulate_expressions(frame_data, row[np.newaxis])
+        
+        if data['has_body']:
+            frame_data.has_body[index] = True
+            for name in (
+                'shoulder_width', 'shoulder_center', 'wrist_positions',
+                'elbow_positions', 'nose_position', 'hip_center'
+            ):
+                if data[name] is not None:
+                    getattr(frame_data, name)[index] = data[name]
+    
+    def _frame_plan(self, frame: np.ndarray) -> _FramePlan:
+        """Look up (or build and cache) the plan for frames of this source size."""
+        h, w = frame.shape[:2]
+        plan = self._frame_plan_cache.get((w, h))
+        if plan is not None:
+            return plan
+        
+        # Long side capped at MAX_FRAME_SIDE
+        dsize = None
+        out_w, out_h = w, h
+        scale = self.MAX_FRAME_SIDE / max(h, w)
+        if scale < 1.0:
+            out_w, out_h = max(1, round(w * scale)), max(1, round(h * scale))
+            dsize = (out_w, out_h)
+        
+        # Camera matrix for the analyzed size
+        focal_length = out_w
+        center = (out_w / 2, out_h / 2)
+        camera_matrix = np.array([
+            [focal_length, 0, center[0]],
+            [0, focal_length, center[1]],
+            [0, 0, 1]
+        ], dtype=np.float64)
+        
+        plan = _FramePlan(
+            dsize=dsize,
+            shape=(out_h, out_w),
+            pixel_scale=np.array([out_w, out_h], dtype=np.float64),
+            source_scale=np.array([w, h], dtype=np.float64),
+            camera_matrix=camera_matrix
+        )
+        self._frame_plan_cache[(w, h)] = plan
+        return plan
+    
+    def _downscale(self, frame: np.ndarray, plan: Optional[_FramePlan] = None) -> np.ndarray:
+        """Resize a frame so its long side is at most MAX_FRAME_SIDE pixels."""
+        if plan is None:
+            plan = self._frame_plan(frame)
+        if plan.dsize is not None:
+            return cv2.resize(frame, plan.dsize, interpolation=cv2.INTER_AREA)
+        return frame
+    
+    @staticmethod
+    def _rgb_buffer_for(frame: np.ndarray, rgb_buffer: Optional[np.ndarray]) -> np.ndarray:
+        """Reuse rgb_buffer for the color conversion of frame, reallocating on shape change."""
+        if rgb_buffer is None or rgb_buffer.shape != frame.shape or rgb_buffer.dtype != frame.dtype:
+            return np.empty_like(frame)
+        return rgb_buffer
+    
+    def _analyze_frame(
+        self,
+        frame: np.ndarray,
+        include_body: bool = True,
+        rgb_buffer: Optional[np.ndarray] = None,
+        plan: Optional[_FramePlan] = None
+    ) -> Dict[str, Any]:
+        """
+        Run Face Mesh and Pose on a single BGR frame (landmark stage).
+        
+        rgb_buffer, if given, receives the RGB conversion so callers can recycle
+        one array across frames. It is only read until this call returns.
+        plan is the frame's cached _FramePlan, looked up from frame if omitted.
+        """
+        if plan is None:
+            plan = self._frame_plan(frame)
+        
+        data = {
+            'shape': frame.shape,
+            'has_face': False,
+            'eye_contact': False,
+            'head_pose': None,
+            'gaze_direction': None,
+            'expressions': None,
+            # Body language data
+            'has_body': False,
+            'pose_landmarks': None,
+            'shoulder_width': None,
+            'wrist_positions': None,
+            'shoulder_center': None,
+            'nose_position': None,
+            'hip_center': None,
+            'elbow_positions': None,
+            # Face crop region for the emotion model
+            'face_box': None
+        }
+        
+        # Convert BGR to RGB for MediaPipe
+        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=rgb_buffer)
+        
+        # Kick off Pose on the worker thread; MediaPipe releases the GIL while
+        # its graph runs, so body detection overlaps Face Mesh below
+        pose_future = None
+        if include_body and self.pose is not None:
+            pose_future = self._pose_executor.submit(self.pose.process, rgb_frame)
+        
+        # Process with Face Mesh (or the Tasks FaceLandmarker)
+        if self._has_face_tracker:
+            face_points = self._detect_face_landmarks(rgb_frame)
             
-            # Process with Face Mesh
-            if self.face_mesh is not None:
-                results = self.face_mesh.process(rgb_frame)
+            if face_points is not None:
+                data['has_face'] = True
+                data['face_box'] = self._face_box(face_points, data['shape'])
                 
-                if results.multi_face_landmarks:
-                    face_landmarks = results.multi_face_landmarks[0]
-                    data['has_face'] = True
-                    
-                    # Extract head pose
-                    data['head_pose'] = self._estimate_head_pose(
-                        face_landmarks, frame.shape
+                # Extract head pose
+                data['head_pose'] = self._estimate_head_pose(face_points, plan)
+                
+                # Estimate gaze direction (None unless iris refinement is enabled)
+                data['gaze_direction'] = self._estimate_gaze(face_points, plan)
+                
+                # Determine eye contact
+                if data['head_pose'] is not None:
+                    yaw, pitch, roll = data['head_pose']
+                    data['eye_contact'] = (
+                        abs(yaw) < self.YAW_THRESHOLD and
+                        abs(pitch) < self.PITCH_THRESHOLD
                     )
+        
+        # Join Pose detection results for body language
+        if pose_future is not None:
+            try:
+                pose_results = pose_future.result()
+                
+                if pose_results.pose_landmarks:
+                    # One (33, 3) copy of all body landmarks, then plain row lookups
+                    landmarks = _landmarks_to_np(pose_results.pose_landmarks)
+                    data['has_body'] = True
+                    data['pose_landmarks'] = landmarks
                     
-                    # Estimate gaze direction
-                    data['gaze_direction'] = self._estimate_gaze(
-                        face_landmarks, frame.shape
-                    )
+                    # Extract key body positions (normalized to image size)
+                    left_shoulder = landmarks[self.POSE_LEFT_SHOULDER]
+                    right_shoulder = landmarks[self.POSE_RIGHT_SHOULDER]
+                    left_hip = landmarks[self.POSE_LEFT_HIP]
+                    right_hip = landmarks[self.POSE_RIGHT_HIP]
                     
-                    # Determine eye contact
-                    if data['head_pose'] is not None:
-                        yaw, pitch, roll = data['head_pose']
-                        data['eye_contact'] = (
-                            abs(yaw) < self.YAW_THRESHOLD and
-                            abs(pitch) < self.PITCH_THRESHOLD
-                        )
-            
-            # Process with Pose detection for body language
-            if self.pose is not None:
-                try:
-                    pose_results = self.pose.process(rgb_frame)
+                    # Calculate shoulder width (for openness metric)
+                    data['shoulder_width'] = abs(right_shoulder[0] - left_shoulder[0])
                     
-                    if pose_results.pose_landmarks:
-                        landmarks = pose_results.pose_landmarks.landmark
-                        data['has_body'] = True
-                        data['pose_landmarks'] = landmarks
-                        
-                        # Extract key body positions (normalized to image size)
-                        left_shoulder = landmarks[self.POSE_LEFT_SHOULDER]
-                        right_shoulder = landmarks[self.POSE_RIGHT_SHOULDER]
-                        left_wrist = landmarks[self.POSE_LEFT_WRIST]
-                        right_wrist = landmarks[self.POSE_RIGHT_WRIST]
-                        left_elbow = landmarks[self.POSE_LEFT_ELBOW]
-                        right_elbow = landmarks[self.POSE_RIGHT_ELBOW]
-                        nose = landmarks[self.POSE_NOSE]
-                        left_hip = landmarks[self.POSE_LEFT_HIP]
-                        right_hip = landmarks[self.POSE_RIGHT_HIP]
-                        
-                        # Calculate shoulder width (for openness metric)
-                        data['shoulder_width'] = abs(right_shoulder.x - left_shoulder.x)
-                        
-                        # Shoulder center position
-                        data['shoulder_center'] = (
-                            (left_shoulder.x + right_shoulder.x) / 2,
-                            (left_shoulder.y + right_shoulder.y) / 2,
-                            (left_shoulder.z + right_shoulder.z) / 2
-                        )
-                        
-                        # Wrist positions for gesture tracking
-                        data['wrist_positions'] = (
-                            (left_wrist.x * w, left_wrist.y * h),
-                            (right_wrist.x * w, right_wrist.y * h)
-                        )
-                        
-                        # Elbow positions for arm cross detection
-                        data['elbow_positions'] = (
-                            (left_elbow.x, left_elbow.y),
-                            (right_elbow.x, right_elbow.y)
-                        )
-                        
-                        # Nose position for forward lean calculation
-                        data['nose_position'] = (nose.x, nose.y, nose.z)
-                        
-                        # Hip center for posture reference
-                        data['hip_center'] = (
-                            (left_hip.x + right_hip.x) / 2,
-                            (left_hip.y + right_hip.y) / 2
-                        )
-                        
-                except Exception as e:
-                    logger.debug(f"Pose detection failed for frame: {e}")
-            
-            # Extract expressions using FER
-            if self.fer_detector is not None:
-                try:
-                    emotions = self.fer_detector.detect_emotions(frame)
-                    if emotions:
-                        data['expressions'] = emotions[0]['emotions']
-                except Exception as e:
-                    logger.debug(f"Expression detection failed for frame: {e}")
-            
-            frame_data.append(data)
+                    # Shoulder center position (x, y, z)
+                    data['shoulder_center'] = (left_shoulder + right_shoulder) / 2
+                    
+                    # Wrist positions for gesture tracking, in source-resolution pixels
+                    # (the gesture thresholds are calibrated for it): rows left, right
+                    data['wrist_positions'] = landmarks[self._POSE_WRIST_IDX, :2] * plan.source_scale
+                    
+                    # Elbow positions for arm cross detection: rows left, right
+                    data['elbow_positions'] = landmarks[self._POSE_ELBOW_IDX, :2]
+                    
+                    # Nose position for forward lean calculation
+                    data['nose_position'] = landmarks[self.POSE_NOSE]
+                    
+                    # Hip center for posture reference
+                    data['hip_center'] = (left_hip[:2] + right_hip[:2]) / 2
+                    
+            except Exception as e:
+                logger.debug(f"Pose detection failed for frame: {e}")
         
-        return frame_data
+        return data
     
-    def _estimate_head_pose(
+    def _detect_face_landmarks(self, rgb_frame: np.ndarray) -> Optional[np.ndarray]:
+        """Landmarks of the first detected face as an (N, 3) array, or None."""
+        with self._face_mesh_lock:
+            if self.face_landmarker is not None:
+                # VIDEO mode needs strictly increasing timestamps across all calls
+                self._landmarker_timestamp_ms += 1
+                results = self.face_landmarker.detect_for_video(
+                    mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_frame),
+                    self._landmarker_timestamp_ms
+                )
+                faces = results.face_landmarks
+            else:
+                faces = self.face_mesh.process(rgb_frame).multi_face_landmarks
+        
+        if not faces:
+            return None
+        return _landmarks_to_np(faces[0])
+    
+    def _detect_expressions(self, frame: np.ndarray, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Run FER on a frame already processed by the landmark stage (expression stage)."""
+        # Skipped on frames where Face Mesh found no face
+        if self.fer_detector is not None and (data['has_face'] or not self._has_face_tracker):
+            # Reuse the Face Mesh box so FER skips its own face detector
+            face_rectangles = None
+            if data['face_box'] is not None:
+                x0, y0, x1, y1 = data['face_box']
+                face_rectangles = [(x0, y0, x1 - x0, y1 - y0)]
+            try:
+                emotions = self.fer_detector.detect_emotions(frame, face_rectangles=face_rectangles)
+                if emotions:
+                    data['expressions'] = emotions[0]['emotions']
+            except Exception as e:
+                logger.debug(f"Expression detection failed for frame: {e}")
+        
+        return data
+    
+    def _emotion_crop(self, frame: np.ndarray, data: Dict[str, Any]) -> Optional[np.ndarray]:
+        """Preprocessed face crop for the ONNX emotion model, or None if no face."""
+        if data['face_box'] is None:
+            return None
+        try:
+            return self.emotion_model.preprocess(frame, data['face_box'])
+        except Exception as e:
+            logger.debug(f"Face crop failed for frame: {e}")
+            return None
+    
+    def _classify_emotion_batch(
+        self,
+        frame_data: FramesSoA,
+        batch: List[Tuple[int, np.ndarray]]
+    ):
+        """Run the ONNX emotion model once over a batch of crops and accumulate the results."""
+        try:
+            probabilities = self.emotion_model.predict_proba(
+                np.stack([crop for _, crop in batch])
+            )
+            self._accumulate_expressions(frame_data, probabilities)
+        except Exception as e:
+            logger.debug(f"Expression detection failed for batch: {e}")
+    
+    def _face_box(
         self,
-        landmarks,
+        landmarks: np.ndarray,
         image_shape: Tuple[int, int, int]
+    ) -> Optional[Tuple[int, int, int, int]]:
+        """
+        Pixel bounding box (x0, y0, x1, y1) of the face oval, clipped to the image.
+        The box indexes the analyzed (downscaled) frame it is cropped from, so it
+        uses that frame's shape rather than the source size.
+        """
+        h, w = image_shape[:2]
+        oval = landmarks[self.FACE_OVAL_INDICES, :2] * (w, h)
+        x0, y0 = np.floor(oval.min(axis=0)).astype(int)
+        x1, y1 = np.ceil(oval.max(axis=0)).astype(int)
+        x0, y0 = max(x0, 0), max(y0, 0)
+        x1, y1 = min(x1, w), min(y1, h)
+        if x1 <= x0 or y1 <= y0:
+            return None
+        return int(x0), int(y0), int(x1), int(y1)
+    
+    def _estimate_head_pose(
+        self,
+        landmarks: np.ndarray,
+        plan: _FramePlan
     ) -> Optional[Tuple[float, float, float]]:
         """
-        Estimate head pose (yaw, pitch, roll) from face landmarks.
+        Estimate head pose (yaw, pitch, roll) from normalized face landmarks.
         Returns angles in degrees.
         """
         try:
-            h, w = image_shape[:2]
-            
-            # 3D model points for pose estimation
-            model_points = np.array([
-                (0.0, 0.0, 0.0),          # Nose tip
-                (0.0, -330.0, -65.0),     # Chin
-                (-225.0, 170.0, -135.0),  # Left eye left corner
-                (225.0, 170.0, -135.0),   # Right eye right corner
-                (-150.0, -150.0, -125.0), # Left mouth corner
-                (150.0, -150.0, -125.0)   # Right mouth corner
-            ], dtype=np.float64)
-            
             # 2D image points from landmarks
-            landmark_indices = [1, 152, 33, 263, 61, 291]  # Corresponding landmarks
-            image_points = np.array([
-                (landmarks.landmark[idx].x * w, landmarks.landmark[idx].y * h)
-                for idx in landmark_indices
-            ], dtype=np.float64)
-            
-            # Camera matrix
-            focal_length = w
-            center = (w / 2, h / 2)
-            camera_matrix = np.array([
-                [focal_length, 0, center[0]],
-                [0, focal_length, center[1]],
-                [0, 0, 1]
-            ], dtype=np.float64)
+            image_points = landmarks[self._POSE_LM_IDX, :2] * plan.pixel_scale
             
-            dist_coeffs = np.zeros((4, 1))
-            
-            # Solve PnP
+            # Solve PnP with closed-form EPnP rather than iterative Levenberg-Marquardt
             success, rotation_vector, translation_vector = cv2.solvePnP(
-                model_points,
+                self._model_points,
                 image_points,
-                camera_matrix,
-                dist_coeffs,
-                flags=cv2.SOLVEPNP_ITERATIVE
+                plan.camera_matrix,
+                self._dist_coeffs,
+                flags=cv2.SOLVEPNP_EPNP
             )
             
             if not success:
@@ -486,40 +1115,37 @@ class VideoPerception:
     
     def _estimate_gaze(
         self,
-        landmarks,
-        image_shape: Tuple[int, int, int]
+        landmarks: np.ndarray,
+        plan: _FramePlan
     ) -> Optional[Tuple[float, float]]:
         """
-        Estimate gaze direction from iris landmarks.
-        Returns (horizontal_offset, vertical_offset) in normalized coordinates.
+        Estimate gaze direction from normalized iris landmarks.
+        Returns (horizontal_offset, vertical_offset) in normalized coordinates,
+        or None when iris refinement is disabled.
         """
+        if not self.refine_iris:
+            return None
+        
         try:
-            h, w = image_shape[:2]
+            # Source-resolution pixels, like the other pixel-space measurements
+            w, h = plan.source_scale
             
-            # Get iris centers
-            if not landmarks.landmark[468].x:  # Check if iris landmarks exist
+            # Check if iris landmarks exist
+            if len(landmarks) <= self.RIGHT_IRIS_INDICES[-1] or not landmarks[468, 0]:
                 return None
             
-            # Left iris center
-            left_iris = np.mean([
-                [landmarks.landmark[idx].x * w, landmarks.landmark[idx].y * h]
-                for idx in self.LEFT_IRIS_INDICES
-            ], axis=0)
-            
-            # Right iris center
-            right_iris = np.mean([
-                [landmarks.landmark[idx].x * w, landmarks.landmark[idx].y * h]
-                for idx in self.RIGHT_IRIS_INDICES
-            ], axis=0)
+            # Left and right iris centers
+            left_iris = landmarks[self.LEFT_IRIS_INDICES, :2].mean(axis=0) * (w, h)
+            right_iris = landmarks[self.RIGHT_IRIS_INDICES, :2].mean(axis=0) * (w, h)
             
             # Left eye bounds
-            left_eye_left = landmarks.landmark[33].x * w
-            left_eye_right = landmarks.landmark[133].x * w
+            left_eye_left = landmarks[33, 0] * w
+            left_eye_right = landmarks[133, 0] * w
             left_eye_center = (left_eye_left + left_eye_right) / 2
             
             # Right eye bounds
-            right_eye_left = landmarks.landmark[362].x * w
-            right_eye_right = landmarks.landmark[263].x * w
+            right_eye_left = landmarks[362, 0] * w
+            right_eye_right = landmarks[263, 0] * w
             right_eye_center = (right_eye_left + right_eye_right) / 2
             
             # Calculate horizontal offset (normalized)
@@ -540,97 +1166,66 @@ class VideoPerception:
     def _aggregate_gaze_metrics(
         self,
         metrics: VideoMetrics,
-        frame_data: List[Dict[str, Any]]
+        frame_data: FramesSoA
     ):
-        """Aggregate gaze and eye contact metrics."""
-        frames_with_face = [f for f in frame_data if f['has_face']]
-        
-        if not frames_with_face:
+        """
+        Aggregate gaze and eye contact metrics.
+        gaze_variance is left at its default when iris refinement is disabled.
+        """
+        face_mask = frame_data.has_face
+        if not face_mask.any():
             return
         
         # Eye contact ratio
-        eye_contact_frames = sum(1 for f in frames_with_face if f['eye_contact'])
-        metrics.eye_contact_ratio = eye_contact_frames / len(frames_with_face)
-        
-        # Gaze variance
-        gaze_directions = [
-            f['gaze_direction'] for f in frames_with_face 
-            if f['gaze_direction'] is not None
-        ]
+        metrics.eye_contact_ratio = float(frame_data.eye_contact[face_mask].mean())
         
-        if gaze_directions:
-            h_offsets = [g[0] for g in gaze_directions]
-            metrics.gaze_variance = float(np.var(h_offsets))
+        # Gaze variance, accumulated while frames were processed
+        if frame_data.gaze_stats.count:
+            metrics.gaze_variance = float(frame_data.gaze_stats.variance[0])
     
     def _aggregate_expression_metrics(
         self,
         metrics: VideoMetrics,
-        frame_data: List[Dict[str, Any]]
+        frame_data: FramesSoA
     ):
-        """Aggregate facial expression metrics."""
-        expressions = [
-            f['expressions'] for f in frame_data 
-            if f['expressions'] is not None
-        ]
-        
-        if not expressions:
+        """Aggregate facial expression metrics from the running expression statistics."""
+        emotion_stats = frame_data.emotion_stats
+        if emotion_stats.count == 0:
             return
         
         # Calculate smile and neutral ratios
-        smile_scores = [e.get('happy', 0) for e in expressions]
-        neutral_scores = [e.get('neutral', 0) for e in expressions]
-        
-        metrics.smile_ratio = float(np.mean(smile_scores))
-        metrics.neutral_face_ratio = float(np.mean(neutral_scores))
+        label_idx = self.EXPRESSION_LABEL_INDEX
+        metrics.smile_ratio = float(emotion_stats.mean[label_idx['happy']])
+        metrics.neutral_face_ratio = float(emotion_stats.mean[label_idx['neutral']])
         
-        # Expression variance (measure of expressiveness)
-        all_expression_vectors = []
-        for e in expressions:
-            vector = [e.get(label, 0) for label in self.EXPRESSION_LABELS]
-            all_expression_vectors.append(vector)
-        
-        if all_expression_vectors:
-            expression_matrix = np.array(all_expression_vectors)
-            # Variance across time for each emotion, then average
-            per_emotion_variance = np.var(expression_matrix, axis=0)
-            metrics.expression_variance = float(np.mean(per_emotion_variance))
+        # Expression variance (measure of expressiveness):
+        # variance across time for each emotion, then average
+        metrics.expression_variance = float(emotion_stats.variance.mean())
         
         # Emotion mismatch (high values for conflicting expressions)
-        mismatch_scores = []
-        for e in expressions:
-            positive = e.get('happy', 0) + e.get('surprise', 0)
-            negative = e.get('angry', 0) + e.get('sad', 0) + e.get('fear', 0)
-            # If both positive and negative are high, there's a mismatch
-            mismatch = min(positive, negative) * 2
-            mismatch_scores.append(mismatch)
-        
-        metrics.emotion_mismatch_score = float(np.mean(mismatch_scores))
+        metrics.emotion_mismatch_score = float(frame_data.mismatch_stats.mean[0])
     
     def _calculate_head_turn_frequency(
         self,
         metrics: VideoMetrics,
-        frame_data: List[Dict[str, Any]],
+        frame_data: FramesSoA,
         fps: float
     ):
         """Calculate head turn frequency from head pose data."""
-        head_poses = [
-            f['head_pose'] for f in frame_data 
-            if f['head_pose'] is not None
-        ]
+        # Yaw values of frames with a head pose estimate
+        yaw_values = frame_data.head_pose[:, 0]
+        yaw_values = np.ascontiguousarray(yaw_values[~np.isnan(yaw_values)])
         
-        if len(head_poses) < 2:
+        if len(yaw_values) < 2:
             return
         
-        # Extract yaw values
-        yaw_values = [p[0] for p in head_poses]
+        # Each analyzed step spans step_frames calibration frames: the threshold
+        # covers that much motion, and a turning step counts once per frame
+        step_frames = self.CALIBRATION_FPS / fps
         
         # Count significant head turns (yaw changes > threshold)
-        turn_threshold = 10.0  # degrees
-        turn_count = 0
-        
-        for i in range(1, len(yaw_values)):
-            if abs(yaw_values[i] - yaw_values[i-1]) > turn_threshold:
-                turn_count += 1
+        turn_threshold = 10.0 * step_frames  # degrees (10 per calibration frame)
+        turn_count = _count_turns(yaw_values, turn_threshold) * step_frames
         
         # Convert to frequency (turns per second)
         duration = len(frame_data) / fps
@@ -640,129 +1235,87 @@ class VideoPerception:
     def _aggregate_body_language_metrics(
         self,
         metrics: VideoMetrics,
-        frame_data: List[Dict[str, Any]],
+        frame_data: FramesSoA,
         fps: float
     ):
         """Aggregate body language metrics from pose data."""
-        frames_with_body = [f for f in frame_data if f['has_body']]
+        body_mask = frame_data.has_body
+        n_body = int(body_mask.sum())
         
-        if not frames_with_body:
+        if n_body == 0:
             return
         
         # Body detection ratio
-        metrics.body_detected_ratio = len(frames_with_body) / len(frame_data)
+        metrics.body_detected_ratio = n_body / len(frame_data)
+        
+        # Body rows only; every body frame carries all pose-derived fields
+        shoulder_widths = frame_data.shoulder_width[body_mask]
+        shoulder_centers = frame_data.shoulder_center[body_mask]
+        wrists = frame_data.wrist_positions[body_mask]
+        elbows = frame_data.elbow_positions[body_mask]
+        noses = frame_data.nose_position[body_mask]
         
         # 1. Shoulder Openness (wider shoulders = more open/confident posture)
-        shoulder_widths = [f['shoulder_width'] for f in frames_with_body if f['shoulder_width'] is not None]
-        if shoulder_widths:
-            # Normalize: typical shoulder width in normalized coords is 0.2-0.4
-            avg_width = np.mean(shoulder_widths)
-            # Map to 0-1 range (0.15 = very closed, 0.45 = very open)
-            metrics.shoulder_openness = float(np.clip((avg_width - 0.15) / 0.30, 0, 1))
-        
-        # 2. Gesture Frequency (hand movements per second)
-        wrist_positions = [f['wrist_positions'] for f in frames_with_body if f['wrist_positions'] is not None]
-        if len(wrist_positions) >= 2:
-            movement_count = 0
-            movement_threshold = 20  # pixels
-            
-            for i in range(1, len(wrist_positions)):
-                prev_left, prev_right = wrist_positions[i-1]
-                curr_left, curr_right = wrist_positions[i]
-                
-                # Calculate movement distance for each hand
-                left_dist = np.sqrt((curr_left[0] - prev_left[0])**2 + (curr_left[1] - prev_left[1])**2)
-                right_dist = np.sqrt((curr_right[0] - prev_right[0])**2 + (curr_right[1] - prev_right[1])**2)
-                
-                # Count as gesture if either hand moved significantly
-                if left_dist > movement_threshold or right_dist > movement_threshold:
-                    movement_count += 1
-            
+        # Normalize: typical shoulder width in normalized coords is 0.2-0.4
+        avg_width = shoulder_widths.mean(dtype=np.float64)
+        # Map to 0-1 range (0.15 = very closed, 0.45 = very open)
+        metrics.shoulder_openness = float(np.clip((avg_width - 0.15) / 0.30, 0, 1))
+        
+        # 2 & 3. Gesture Frequency and Amplitude from a single pass over wrist movement
+        if n_body >= 2:
+            # Thresholds are per calibration frame; see _calculate_head_turn_frequency
+            step_frames = self.CALIBRATION_FPS / fps
+            movement_threshold = 20 * step_frames  # pixels (20 per calibration frame)
+
+            # Per-frame movement distance for each hand: shape (N-1, 2)
+            dists = np.linalg.norm(np.diff(wrists.astype(np.float64), axis=0), axis=2)
+
+            # Count as gesture if either hand moved significantly
+            movement_count = int((dists.max(axis=1) > movement_threshold).sum()) * step_frames
+
             duration = len(frame_data) / fps
             if duration > 0:
                 metrics.gesture_frequency = float(movement_count / duration)
-        
-        # 3. Gesture Amplitude (average movement size)
-        if len(wrist_positions) >= 2:
-            all_movements = []
-            for i in range(1, len(wrist_positions)):
-                prev_left, prev_right = wrist_positions[i-1]
-                curr_left, curr_right = wrist_positions[i]
-                
-                left_dist = np.sqrt((curr_left[0] - prev_left[0])**2 + (curr_left[1] - prev_left[1])**2)
-                right_dist = np.sqrt((curr_right[0] - prev_right[0])**2 + (curr_right[1] - prev_right[1])**2)
-                all_movements.extend([left_dist, right_dist])
-            
-            if all_movements:
-                # Normalize to 0-1 (0-100 pixels mapped)
-                metrics.gesture_amplitude = float(np.clip(np.mean(all_movements) / 100, 0, 1))
+
+            # Normalize average movement per calibration frame to 0-1 (0-100 pixels mapped)
+            metrics.gesture_amplitude = float(np.clip(dists.mean() / step_frames / 100, 0, 1))
         
         # 4. Posture Stability (low variance = stable, high = fidgety)
-        shoulder_centers = [f['shoulder_center'] for f in frames_with_body if f['shoulder_center'] is not None]
-        if len(shoulder_centers) >= 2:
-            x_positions = [sc[0] for sc in shoulder_centers]
-            y_positions = [sc[1] for sc in shoulder_centers]
-            
-            # Calculate position variance
-            position_variance = np.var(x_positions) + np.var(y_positions)
+        if n_body >= 2:
+            # Calculate position variance of the shoulder center in x and y
+            position_variance = shoulder_centers[:, :2].var(axis=0, dtype=np.float64).sum()
             
             # Invert: low variance = high stability (1), high variance = low stability (0)
             # Typical variance range: 0 to 0.01
             metrics.posture_stability = float(np.clip(1 - (position_variance * 100), 0, 1))
         
         # 5. Forward Lean (nose position relative to shoulders indicates engagement)
-        forward_leans = []
-        for f in frames_with_body:
-            if f['nose_position'] is not None and f['shoulder_center'] is not None:
-                nose_z = f['nose_position'][2]
-                shoulder_z = f['shoulder_center'][2]
-                # Positive = leaning forward (nose closer to camera than shoulders)
-                lean = shoulder_z - nose_z
-                forward_leans.append(lean)
-        
-        if forward_leans:
-            # Normalize: typical range -0.1 to 0.1
-            avg_lean = np.mean(forward_leans)
-            metrics.forward_lean = float(np.clip(avg_lean * 5, -1, 1))
+        # Positive = leaning forward (nose closer to camera than shoulders)
+        forward_leans = shoulder_centers[:, 2] - noses[:, 2]
+        # Normalize: typical range -0.1 to 0.1
+        avg_lean = forward_leans.mean(dtype=np.float64)
+        metrics.forward_lean = float(np.clip(avg_lean * 5, -1, 1))
         
         # 6. Hand to Face Ratio (hands near face = nervousness indicator)
-        hand_to_face_frames = 0
-        for f in frames_with_body:
-            if f['wrist_positions'] is not None and f['nose_position'] is not None:
-                left_wrist, right_wrist = f['wrist_positions']
-                nose_y = f['nose_position'][1]
-                
-                # Check if either hand is at face level (wrist y close to nose y)
-                # In normalized coords, nose_y is typically 0.3-0.5
-                left_near_face = abs(left_wrist[1] / 480 - nose_y) < 0.15  # Assuming ~480px height
-                right_near_face = abs(right_wrist[1] / 480 - nose_y) < 0.15
-                
-                if left_near_face or right_near_face:
-                    hand_to_face_frames += 1
-        
-        if frames_with_body:
-            metrics.hand_to_face_ratio = float(hand_to_face_frames / len(frames_with_body))
+        # Check if either hand is at face level (wrist y close to nose y)
+        # In normalized coords, nose_y is typically 0.3-0.5
+        near_face = np.abs(wrists[:, :, 1] / 480 - noses[:, 1:2]) < 0.15  # Assuming ~480px height
+        metrics.hand_to_face_ratio = float(near_face.any(axis=1).mean())
         
         # 7. Arm Cross Ratio (elbows crossed in front = defensive posture)
-        arm_cross_frames = 0
-        for f in frames_with_body:
-            if f['elbow_positions'] is not None and f['shoulder_center'] is not None:
-                left_elbow, right_elbow = f['elbow_positions']
-                shoulder_center_x = f['shoulder_center'][0]
-                
-                # Arms crossed when elbows are on opposite sides of center
-                left_crossed = left_elbow[0] > shoulder_center_x
-                right_crossed = right_elbow[0] < shoulder_center_x
-                
-                if left_crossed and right_crossed:
-                    arm_cross_frames += 1
-        
-        if frames_with_body:
-            metrics.arm_cross_ratio = float(arm_cross_frames / len(frames_with_body))
+        # Arms crossed when elbows are on opposite sides of center
+        shoulder_center_x = shoulder_centers[:, 0]
+        left_crossed = elbows[:, 0, 0] > shoulder_center_x
+        right_crossed = elbows[:, 1, 0] < shoulder_center_x
+        metrics.arm_cross_ratio = float((left_crossed & right_crossed).mean())
     
     def close(self):
         """Release resources."""
         if self.face_mesh:
             self.face_mesh.close()
+        if self.face_landmarker:
+            self.face_landmarker.close()
+        if self._pose_executor:
+            self._pose_executor.shutdown(wait=True)
         if self.pose:
             self.pose.close()
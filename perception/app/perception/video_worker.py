@@ -0,0 +1,82 @@
+"""
+Video Worker - Runs video perception in a pool of worker processes.
+MediaPipe and expression inference are CPU-bound and hold the GIL for long
+stretches, so they run outside the API process. Each worker builds its own
+VideoPerception on first use; detectors are never shared across processes.
+"""
+
+import os
+import base64
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Per-process detector instance, created lazily inside each worker
+_video_perception = None
+
+
+def _get_video_perception():
+    """Return this process's VideoPerception, building it on first call."""
+    global _video_perception
+    if _video_perception is None:
+        from app.config import settings
+        from app.perception.video_perception import VideoPerception
+
+        _video_perception = VideoPerception(
+            pose_complexity=settings.video_pose_complexity,
+            refine_iris=settings.video_refine_iris,
+            emotion_model_path=settings.face_emotion_model_path,
+            face_landmarker_model_path=settings.face_landmarker_model_path
+        )
+        logger.info(f"Video perception initialized in worker {os.getpid()}")
+    return _video_perception
+
+
+def extract_video_metrics(video_base64: str, fps: float = 30.0) -> Dict[str, float]:
+    """
+    Decode a base64 video payload and extract raw metrics (runs in a worker process).
+
+    The payload is decoded here rather than in the API process, so the decoded
+    bytes exist only once, in the worker that reads them.
+    """
+    video_data = base64.b64decode(video_base64)
+    metrics = _get_video_perception().extract_metrics(video_data=video_data, fps=fps)
+    return metrics.to_dict()
+
+
+def extract_image_metrics(image_base64: str) -> Dict[str, float]:
+    """Decode a base64 image payload and extract raw metrics (runs in a worker process)."""
+    image_data = base64.b64decode(image_base64)
+    metrics = _get_video_perception().extract_metrics_from_image(image_data)
+    return metrics.to_dict()
+
+
+def default_pool_size(web_workers: int = 1) -> int:
+    """
+    Video worker processes per API process: the CPUs split across all
+    web workers, so each of them sizing its own pool does not oversubscribe.
+    """
+    return max(1, (os.cpu_count() or 1) // max(1, web_workers))
+
+
+def create_video_executor(
+    max_workers: Optional[int] = None,
+    web_workers: int = 1
+) -> ProcessPoolExecutor:
+    """
+    Create the process pool for video work.
+
+    Workers are spawned rather than forked so they never inherit the parent's
+    threads or model state. Processes start on first submit.
+
+    Args:
+        max_workers: Number of worker processes (defaults to default_pool_size)
+        web_workers: Number of web server worker processes, each with its own pool
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers or default_pool_size(web_workers),
+        mp_context=multiprocessing.get_context("spawn")
+    )
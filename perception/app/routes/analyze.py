@@ -2,11 +2,17 @@
 Analysis routes for the perception layer.
 """
 
+import asyncio
 import base64
 import time
 import logging
-from typing import Optional
-from fastapi import APIRouter, HTTPException
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional, Dict, Any, Awaitable, Callable, List, Type, TypeVar
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ValidationError
 
 from app.schemas import (
     AnalyzeRequest,
@@ -17,11 +23,21 @@ from app.schemas import (
     ImageInput,
     TextMetricsResponse,
     AudioMetricsResponse,
-    VideoMetricsResponse
+    VideoMetricsResponse,
+    default_metrics,
+    parse_text_input,
+    parse_audio_input,
+    parse_video_input,
+    parse_image_input,
+    parse_analyze_request
 )
 from app.perception.text_perception import TextPerception
 from app.perception.audio_perception import AudioPerception
-from app.perception.video_perception import VideoPerception
+from app.perception.video_worker import (
+    create_video_executor,
+    extract_video_metrics,
+    extract_image_metrics
+)
 from app.utils.normalization import Normalizer
 from app.config import settings
 
@@ -29,101 +45,297 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/analyze", tags=["Analysis"])
 
+# Unvalidated fast paths for trusted internal callers
+internal_router = APIRouter(prefix="/internal", tags=["Internal"])
+
 # Initialize perception modules (stateless, can be reused)
 text_perception = TextPerception()
 audio_perception = AudioPerception()
-video_perception = VideoPerception()
+
+# Video perception is CPU-bound and runs in worker processes, each with its own
+# detectors, so it never blocks the event loop
+video_executor = create_video_executor(settings.video_worker_processes, settings.web_concurrency)
 normalizer = Normalizer(
     use_zscore=settings.use_zscore_normalization,
     clip_range=settings.normalization_clip_range
 )
 
 
-@router.post("", response_model=AnalyzeResponse)
-async def analyze(request: AnalyzeRequest) -> AnalyzeResponse:
+T = TypeVar("T")
+
+
+def _json_body(parse: Callable[[bytes], T]):
     """
-    Analyze multimodal input and return structured numeric features.
+    Build a dependency that validates the raw request body with a schema parser.
+
+    The body bytes go straight to the module-level TypeAdapter, so JSON decoding
+    and validation happen in one pydantic-core pass. Validation failures are
+    reported as the usual 422 response.
+    """
+    async def dependency(request: Request) -> T:
+        body = await request.body()
+        try:
+            return parse(body)
+        except ValidationError as e:
+            raise RequestValidationError(
+                [{**error, "loc": ("body", *error["loc"])} for error in e.errors()]
+            )
     
-    Accepts text, audio, and/or video input. Returns normalized metrics
-    suitable for downstream scoring and decision layers.
+    return dependency
+
+
+def _inline_refs(schema: Any, defs: Dict[str, Any]) -> Any:
+    """Replace local "#/$defs/..." references with the definitions they point to."""
+    if isinstance(schema, dict):
+        ref = schema.get("$ref", "")
+        if ref.startswith("#/$defs/"):
+            return _inline_refs(defs[ref[len("#/$defs/"):]], defs)
+        return {key: _inline_refs(value, defs) for key, value in schema.items()}
+    if isinstance(schema, list):
+        return [_inline_refs(item, defs) for item in schema]
+    return schema
+
+
+def _json_body_openapi(model: Type[BaseModel]) -> Dict[str, Any]:
     """
-    start_time = time.time()
+    OpenAPI requestBody for a route that reads its body through _json_body.
     
-    raw_text_metrics = None
-    raw_audio_metrics = None
-    raw_video_metrics = None
+    FastAPI only documents bodies it parses itself, so routes using _json_body
+    pass this as openapi_extra. Nested models are inlined, because "$defs"
+    references do not resolve inside the OpenAPI document.
+    """
+    schema = model.model_json_schema()
+    defs = schema.pop("$defs", {})
+    return {
+        "requestBody": {
+            "content": {"application/json": {"schema": _inline_refs(schema, defs)}},
+            "required": True
+        }
+    }
+
+
+def _extract_text_metrics(
+    user_responses: List[str],
+    interviewer_questions: Optional[List[str]],
+    response_durations: Optional[List[float]]
+) -> Dict[str, Any]:
+    """Run text perception (blocking; called in a worker thread)."""
+    text_metrics = text_perception.extract_metrics(
+        user_responses=user_responses,
+        interviewer_questions=interviewer_questions,
+        response_durations=response_durations
+    )
+    return text_metrics.to_dict()
+
+
+def _extract_audio_metrics(
+    audio_base64: str,
+    word_count: Optional[int],
+    sample_rate: Optional[int]
+) -> Dict[str, Any]:
+    """Run audio perception (blocking; called in a worker thread)."""
+    audio_bytes = base64.b64decode(audio_base64)
+    audio_metrics = audio_perception.extract_metrics(
+        audio_data=audio_bytes,
+        word_count=word_count,
+        sample_rate=sample_rate
+    )
+    return audio_metrics.to_dict()
+
+
+async def _run_in_video_pool(func: Callable[..., T], *args: Any) -> T:
+    """
+    Run a function in the video worker pool.
     
-    # Process text if provided
-    if request.text:
-        try:
-            text_metrics = text_perception.extract_metrics(
-                user_responses=request.text.user_responses,
-                interviewer_questions=request.text.interviewer_questions,
-                response_durations=request.text.response_durations
+    A worker that dies mid-task (for example, killed for memory) breaks the
+    whole pool, and every later submit would fail. The broken pool is replaced
+    with a fresh one and the request gets a 503. The task is not retried,
+    because the payload may be what killed the worker.
+    """
+    global video_executor
+    executor = video_executor
+    try:
+        return await asyncio.get_running_loop().run_in_executor(executor, func, *args)
+    except BrokenProcessPool:
+        # Requests in flight on the same pool fail together; rebuild it only once
+        if video_executor is executor:
+            logger.error("Video worker pool is broken, starting a new one")
+            video_executor = create_video_executor(
+                settings.video_worker_processes, settings.web_concurrency
             )
-            raw_text_metrics = text_metrics.to_dict()
-        except Exception as e:
-            logger.error(f"Text processing error: {e}")
-            raw_text_metrics = TextMetricsResponse().model_dump()
+            executor.shutdown(wait=False, cancel_futures=True)
+        raise HTTPException(status_code=503, detail="Video worker crashed, retry the request")
+
+
+def shutdown_video_executor() -> None:
+    """Stop the current video worker pool (called at application shutdown)."""
+    video_executor.shutdown(wait=True, cancel_futures=True)
+
+
+async def _extract_video_metrics(video_base64: str, fps: Optional[float]) -> Dict[str, Any]:
+    """Run video perception in the video worker pool."""
+    # The worker decodes the base64 payload itself
+    return await _run_in_video_pool(extract_video_metrics, video_base64, fps or 30.0)
+
+
+# Fallback metrics for a modality whose processing failed
+_DEFAULT_METRICS = {
+    "text": default_metrics(TextMetricsResponse),
+    "audio": default_metrics(AudioMetricsResponse),
+    "video": default_metrics(VideoMetricsResponse)
+}
+
+
+async def _run_analysis(
+    tasks: Dict[str, Awaitable[Dict[str, Any]]],
+    normalize: bool,
+    include_raw: bool,
+    start_time: float
+) -> AnalyzeResponse:
+    """
+    Await the per-modality extraction tasks, then normalize and assemble the
+    combined response. Shared by the validated and internal analyze routes.
+    """
+    results = await asyncio.gather(*tasks.values(), return_exceptions=True)
     
-    # Process audio if provided
-    if request.audio:
-        try:
-            audio_bytes = base64.b64decode(request.audio.audio_base64)
-            audio_metrics = audio_perception.extract_metrics(
-                audio_data=audio_bytes,
-                word_count=request.audio.word_count,
-                sample_rate=request.audio.sample_rate
-            )
-            raw_audio_metrics = audio_metrics.to_dict()
-        except Exception as e:
-            logger.error(f"Audio processing error: {e}")
-            raw_audio_metrics = AudioMetricsResponse().model_dump()
+    raw = {"text": None, "audio": None, "video": None}
+    for modality, result in zip(tasks, results):
+        if isinstance(result, Exception):
+            logger.error(f"{modality.capitalize()} processing error: {result}")
+            result = dict(_DEFAULT_METRICS[modality])
+        raw[modality] = result
     
-    # Process video if provided
-    if request.video:
-        try:
-            video_bytes = base64.b64decode(request.video.video_base64)
-            video_metrics = video_perception.extract_metrics(
-                video_data=video_bytes,
-                fps=request.video.fps or 30.0
-            )
-            raw_video_metrics = video_metrics.to_dict()
-        except Exception as e:
-            logger.error(f"Video processing error: {e}")
-            raw_video_metrics = VideoMetricsResponse().model_dump()
-    
-    # Build response
-    response = AnalyzeResponse(
-        processing_time_ms=(time.time() - start_time) * 1000
-    )
+    raw_text_metrics = raw["text"]
+    raw_audio_metrics = raw["audio"]
+    raw_video_metrics = raw["video"]
+    
+    processing_time_ms = (time.time() - start_time) * 1000
     
     # Normalize if requested
-    if request.normalize:
-        if raw_text_metrics:
-            response.text_metrics = normalizer.normalize_metrics(raw_text_metrics)
-        if raw_audio_metrics:
-            response.audio_metrics = normalizer.normalize_metrics(raw_audio_metrics)
-        if raw_video_metrics:
-            response.video_metrics = normalizer.normalize_metrics(raw_video_metrics)
+    if normalize and settings.concurrent_normalization:
+        normalized = await normalizer.normalize_all_async(
+            raw_text_metrics or {}, raw_audio_metrics or {}, raw_video_metrics or {}
+        )
+        text_metrics = normalized["text_metrics"] if raw_text_metrics else None
+        audio_metrics = normalized["audio_metrics"] if raw_audio_metrics else None
+        video_metrics = normalized["video_metrics"] if raw_video_metrics else None
+    elif normalize:
+        # One kernel call for all modalities
+        normalized = normalizer.normalize_all(
+            raw_text_metrics or {}, raw_audio_metrics or {}, raw_video_metrics or {}
+        )
+        text_metrics = normalized["text_metrics"] if raw_text_metrics else None
+        audio_metrics = normalized["audio_metrics"] if raw_audio_metrics else None
+        video_metrics = normalized["video_metrics"] if raw_video_metrics else None
     else:
-        response.text_metrics = raw_text_metrics
-        response.audio_metrics = raw_audio_metrics
-        response.video_metrics = raw_video_metrics
+        text_metrics = raw_text_metrics
+        audio_metrics = raw_audio_metrics
+        video_metrics = raw_video_metrics
     
     # Include raw metrics if requested
-    if request.include_raw:
-        response.raw_metrics = {
+    raw_metrics = None
+    if include_raw:
+        raw_metrics = {
             "text_metrics": raw_text_metrics,
             "audio_metrics": raw_audio_metrics,
             "video_metrics": raw_video_metrics
         }
     
-    return response
+    return AnalyzeResponse(
+        text_metrics=text_metrics,
+        audio_metrics=audio_metrics,
+        video_metrics=video_metrics,
+        raw_metrics=raw_metrics,
+        processing_time_ms=processing_time_ms
+    )
 
 
-@router.post("/text", response_model=dict)
-async def analyze_text(request: TextInput) -> dict:
+@router.post("", response_model=AnalyzeResponse, openapi_extra=_json_body_openapi(AnalyzeRequest))
+async def analyze(
+    request: AnalyzeRequest = Depends(_json_body(parse_analyze_request))
+) -> AnalyzeResponse:
+    """
+    Analyze multimodal input and return structured numeric features.
+    
+    Accepts text, audio, and/or video input. Returns normalized metrics
+    suitable for downstream scoring and decision layers.
+    
+    The modalities share no state, so they are processed concurrently:
+    text and audio in threads, video in the worker process pool.
+    """
+    start_time = time.time()
+    
+    tasks = {}
+    if request.text:
+        text = request.text
+        tasks["text"] = asyncio.to_thread(
+            _extract_text_metrics,
+            text.user_responses,
+            text.interviewer_questions,
+            text.response_durations
+        )
+    if request.audio:
+        audio = request.audio
+        tasks["audio"] = asyncio.to_thread(
+            _extract_audio_metrics, audio.audio_base64, audio.word_count, audio.sample_rate
+        )
+    if request.video:
+        tasks["video"] = _extract_video_metrics(request.video.video_base64, request.video.fps)
+    
+    return await _run_analysis(tasks, request.normalize, request.include_raw, start_time)
+
+
+@internal_router.post("/analyze", openapi_extra=_json_body_openapi(AnalyzeRequest))
+async def analyze_internal(request: Request) -> ORJSONResponse:
+    """
+    Trusted fast path of POST /analyze for internal service callers.
+    
+    Takes the same JSON body and returns the same response, but pydantic is not
+    involved on either side: the body is decoded with orjson and read as a plain
+    dict, and the result is encoded straight back with orjson.
+    
+    Unlike /analyze, the input is NOT validated. Undecodable JSON or a missing
+    required field gives a 400 with no per-field detail; wrong value types are
+    only caught by the perception modules, which report them as that
+    modality's processing error (zeroed metrics). Only expose this route to
+    trusted internal callers.
+    """
+    start_time = time.time()
+    
+    try:
+        body = orjson.loads(await request.body())
+        text = body.get("text")
+        audio = body.get("audio")
+        video = body.get("video")
+        
+        text_args = (
+            text["user_responses"], text.get("interviewer_questions"), text.get("response_durations")
+        ) if text else None
+        audio_args = (
+            audio["audio_base64"], audio.get("word_count"), audio.get("sample_rate")
+        ) if audio else None
+        video_args = (video["video_base64"], video.get("fps")) if video else None
+        
+        normalize = body.get("normalize", True)
+        include_raw = body.get("include_raw", False)
+    except (orjson.JSONDecodeError, AttributeError, KeyError, TypeError) as e:
+        raise HTTPException(status_code=400, detail=f"Malformed request body: {e!r}")
+    
+    tasks = {}
+    if text_args:
+        tasks["text"] = asyncio.to_thread(_extract_text_metrics, *text_args)
+    if audio_args:
+        tasks["audio"] = asyncio.to_thread(_extract_audio_metrics, *audio_args)
+    if video_args:
+        tasks["video"] = _extract_video_metrics(*video_args)
+    
+    return ORJSONResponse(await _run_analysis(tasks, normalize, include_raw, start_time))
+
+
+@router.post("/text", response_model=dict, openapi_extra=_json_body_openapi(TextInput))
+async def analyze_text(
+    request: TextInput = Depends(_json_body(parse_text_input))
+) -> dict:
     """Analyze text input only."""
     start_time = time.time()
     
@@ -146,8 +358,10 @@ async def analyze_text(request: TextInput) -> dict:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/audio", response_model=dict)
-async def analyze_audio(request: AudioInput) -> dict:
+@router.post("/audio", response_model=dict, openapi_extra=_json_body_openapi(AudioInput))
+async def analyze_audio(
+    request: AudioInput = Depends(_json_body(parse_audio_input))
+) -> dict:
     """Analyze audio input only."""
     start_time = time.time()
     
@@ -171,18 +385,15 @@ async def analyze_audio(request: AudioInput) -> dict:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/video", response_model=dict)
-async def analyze_video(request: VideoInput) -> dict:
+@router.post("/video", response_model=dict, openapi_extra=_json_body_openapi(VideoInput))
+async def analyze_video(
+    request: VideoInput = Depends(_json_body(parse_video_input))
+) -> dict:
     """Analyze video input only."""
     start_time = time.time()
     
     try:
-        video_bytes = base64.b64decode(request.video_base64)
-        metrics = video_perception.extract_metrics(
-            video_data=video_bytes,
-            fps=request.fps or 30.0
-        )
-        raw_metrics = metrics.to_dict()
+        raw_metrics = await _extract_video_metrics(request.video_base64, request.fps)
         normalized = normalizer.normalize_metrics(raw_metrics)
         
         return {
@@ -190,20 +401,22 @@ async def analyze_video(request: VideoInput) -> dict:
             "raw_metrics": raw_metrics,
             "processing_time_ms": (time.time() - start_time) * 1000
         }
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Video analysis error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/image", response_model=dict)
-async def analyze_image(request: ImageInput) -> dict:
+@router.post("/image", response_model=dict, openapi_extra=_json_body_openapi(ImageInput))
+async def analyze_image(
+    request: ImageInput = Depends(_json_body(parse_image_input))
+) -> dict:
     """Analyze single image for facial metrics."""
     start_time = time.time()
     
     try:
-        image_bytes = base64.b64decode(request.image_base64)
-        metrics = video_perception.extract_metrics_from_image(image_bytes)
-        raw_metrics = metrics.to_dict()
+        raw_metrics = await _run_in_video_pool(extract_image_metrics, request.image_base64)
         normalized = normalizer.normalize_metrics(raw_metrics)
         
         return {
@@ -211,6 +424,8 @@ async def analyze_image(request: ImageInput) -> dict:
             "raw_metrics": raw_metrics,
             "processing_time_ms": (time.time() - start_time) * 1000
         }
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Image analysis error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -1,9 +1,19 @@
 """
 Pydantic schemas for API request/response models.
+
+Metric and analysis responses are TypedDicts: endpoints return plain dicts and
+no model objects are allocated. Their TypeAdapters can dump them to JSON inside
+pydantic-core when needed.
+
+The remaining response models (HealthResponse) are frozen and forbid extra
+fields, and may be created with Model.model_construct(...), which skips
+validation. Only use it for server-built data: request bodies (TextInput,
+AudioInput, AnalyzeRequest, ...) must always go through normal validation.
 """
 
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from typing import List, Optional, Dict, Any, get_type_hints
+from typing_extensions import Annotated, TypedDict
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 class TextInput(BaseModel):
@@ -81,71 +91,126 @@ class AnalyzeRequest(BaseModel):
     )
 
 
-class TextMetricsResponse(BaseModel):
+# Request body validators, built once at import so core-schema compilation is
+# never paid on a request path. validate_json() parses the raw body bytes
+# inside pydantic-core without an intermediate Python dict.
+TEXT_INPUT_ADAPTER = TypeAdapter(TextInput)
+AUDIO_INPUT_ADAPTER = TypeAdapter(AudioInput)
+AUDIO_SEGMENTS_INPUT_ADAPTER = TypeAdapter(AudioSegmentsInput)
+VIDEO_INPUT_ADAPTER = TypeAdapter(VideoInput)
+IMAGE_INPUT_ADAPTER = TypeAdapter(ImageInput)
+ANALYZE_REQUEST_ADAPTER = TypeAdapter(AnalyzeRequest)
+
+
+def parse_text_input(body: bytes) -> TextInput:
+    """Validate a JSON request body as TextInput."""
+    return TEXT_INPUT_ADAPTER.validate_json(body)
+
+
+def parse_audio_input(body: bytes) -> AudioInput:
+    """Validate a JSON request body as AudioInput."""
+    return AUDIO_INPUT_ADAPTER.validate_json(body)
+
+
+def parse_audio_segments_input(body: bytes) -> AudioSegmentsInput:
+    """Validate a JSON request body as AudioSegmentsInput."""
+    return AUDIO_SEGMENTS_INPUT_ADAPTER.validate_json(body)
+
+
+def parse_video_input(body: bytes) -> VideoInput:
+    """Validate a JSON request body as VideoInput."""
+    return VIDEO_INPUT_ADAPTER.validate_json(body)
+
+
+def parse_image_input(body: bytes) -> ImageInput:
+    """Validate a JSON request body as ImageInput."""
+    return IMAGE_INPUT_ADAPTER.validate_json(body)
+
+
+def parse_analyze_request(body: bytes) -> AnalyzeRequest:
+    """Validate a JSON request body as AnalyzeRequest."""
+    return ANALYZE_REQUEST_ADAPTER.validate_json(body)
+
+
+class TextMetricsResponse(TypedDict, total=False):
     """Response schema for text metrics."""
-    semantic_relevance_mean: float = 0.0
-    semantic_relevance_std: float = 0.0
-    topic_drift_ratio: float = 0.0
-    avg_sentence_length: float = 0.0
-    sentence_length_std: float = 0.0
-    avg_response_length_sec: float = 0.0
-    response_length_consistency: float = 0.0
-    assertive_phrase_ratio: float = 0.0
-    modal_verb_ratio: float = 0.0
-    hedge_ratio: float = 0.0
-    filler_word_ratio: float = 0.0
-    empathy_phrase_ratio: float = 0.0
-    reflective_response_ratio: float = 0.0
-    question_back_ratio: float = 0.0
-    avg_sentiment: float = 0.0
-    sentiment_variance: float = 0.0
-    negative_spike_count: int = 0
-
-
-class AudioMetricsResponse(BaseModel):
+    semantic_relevance_mean: float
+    semantic_relevance_std: float
+    topic_drift_ratio: float
+    avg_sentence_length: float
+    sentence_length_std: float
+    avg_response_length_sec: float
+    response_length_consistency: float
+    assertive_phrase_ratio: float
+    modal_verb_ratio: float
+    hedge_ratio: float
+    filler_word_ratio: float
+    empathy_phrase_ratio: float
+    reflective_response_ratio: float
+    question_back_ratio: float
+    avg_sentiment: float
+    sentiment_variance: float
+    negative_spike_count: int
+
+
+class AudioMetricsResponse(TypedDict, total=False):
     """Response schema for audio metrics."""
-    speech_rate_wpm: float = 0.0
-    speech_rate_variance: float = 0.0
-    mean_pause_duration: float = 0.0
-    pause_frequency: float = 0.0
-    silence_ratio: float = 0.0
-    pitch_mean: float = 0.0
-    pitch_variance: float = 0.0
-    energy_mean: float = 0.0
-    energy_variance: float = 0.0
-    monotony_score: float = 0.0
-    audio_confidence_prob: float = 0.0
-    audio_nervous_prob: float = 0.0
-    audio_calm_prob: float = 0.0
-    emotion_consistency: float = 0.0
-
-
-class VideoMetricsResponse(BaseModel):
+    speech_rate_wpm: float
+    speech_rate_variance: float
+    mean_pause_duration: float
+    pause_frequency: float
+    silence_ratio: float
+    pitch_mean: float
+    pitch_variance: float
+    energy_mean: float
+    energy_variance: float
+    monotony_score: float
+    audio_confidence_prob: float
+    audio_nervous_prob: float
+    audio_calm_prob: float
+    emotion_consistency: float
+
+
+class VideoMetricsResponse(TypedDict, total=False):
     """Response schema for video metrics."""
-    eye_contact_ratio: float = 0.0
-    gaze_variance: float = 0.0
-    head_turn_frequency: float = 0.0
-    expression_variance: float = 0.0
-    smile_ratio: float = 0.0
-    neutral_face_ratio: float = 0.0
-    emotion_mismatch_score: float = 0.0
+    eye_contact_ratio: float
+    gaze_variance: float
+    head_turn_frequency: float
+    expression_variance: float
+    smile_ratio: float
+    neutral_face_ratio: float
+    emotion_mismatch_score: float
 
 
-class AnalyzeResponse(BaseModel):
+class AnalyzeResponse(TypedDict):
     """Combined analysis response."""
-    text_metrics: Optional[Dict[str, Any]] = None
-    audio_metrics: Optional[Dict[str, Any]] = None
-    video_metrics: Optional[Dict[str, Any]] = None
-    raw_metrics: Optional[Dict[str, Dict[str, Any]]] = Field(
-        None, description="Raw unnormalized metrics if requested"
-    )
-    processing_time_ms: float = Field(
-        0.0, description="Total processing time in milliseconds"
-    )
+    text_metrics: Optional[Dict[str, Any]]
+    audio_metrics: Optional[Dict[str, Any]]
+    video_metrics: Optional[Dict[str, Any]]
+    # Any skips pydantic's walk over the nested dicts; callers must pass plain
+    # {modality: {feature: value}} dicts of JSON-serializable values
+    raw_metrics: Annotated[Any, Field(description="Raw unnormalized metrics if requested")]
+    processing_time_ms: Annotated[
+        float, Field(description="Total processing time in milliseconds")
+    ]
+
+
+# Response serializers, likewise built at import
+TEXT_METRICS_ADAPTER = TypeAdapter(TextMetricsResponse)
+AUDIO_METRICS_ADAPTER = TypeAdapter(AudioMetricsResponse)
+VIDEO_METRICS_ADAPTER = TypeAdapter(VideoMetricsResponse)
+ANALYZE_RESPONSE_ADAPTER = TypeAdapter(AnalyzeResponse)
+
+
+def default_metrics(schema: type) -> Dict[str, Any]:
+    """Zero-valued metrics dict with every key of a metrics TypedDict."""
+    return {name: field_type() for name, field_type in get_type_hints(schema).items()}
 
 
 class HealthResponse(BaseModel):
     """Health check response."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     status: str
     models_loaded: bool
     version: str = "1.0.0"
@@ -3,15 +3,42 @@ Normalization Utilities - Z-score and Min-Max normalization for features.
 Uses predefined global statistics without updating state during inference.
 """
 
+import sys
+import asyncio
+import threading
 import numpy as np
-from typing import Dict, Any, Optional
+from math import sqrt as _sqrt
+# Hot-path callables bound once, so per-call code skips the module attribute lookups
+from numpy import (
+    asarray as _np_asarray,
+    clip as _np_clip,
+    divide as _np_divide,
+    fromiter as _np_fromiter,
+    subtract as _np_subtract
+)
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Mapping, Sequence, Tuple, Union
 from dataclasses import dataclass
 import logging
 
 logger = logging.getLogger(__name__)
 
+_FLOAT64 = np.dtype(np.float64)
+_INTP = np.dtype(np.intp)
 
-@dataclass
+# Below this many values, a plain Python loop beats the NumPy call overhead
+_SMALL_BASELINE_SIZE = 64
+
+# Bounded LRU cache of normalize_metrics results, for dicts below the size limit
+_CACHE_SIZE = 256
+_CACHE_MAX_ITEMS = 64
+# Value types a cache key may hold: hashable, and equal only to their own kind
+# once the type is part of the key
+_CACHEABLE_TYPES = frozenset((float, int, bool, str, type(None)))
+
+
+@dataclass(frozen=True, slots=True)
 class FeatureStatistics:
     """Predefined statistics for feature normalization."""
     mean: float = 0.0
@@ -24,7 +51,7 @@ class FeatureStatistics:
 # These are calibrated based on actual interview session distributions
 # For min-max normalization: raw values are scaled to [0,1] based on [min_val, max_val]
 # The normalized value = raw value directly (no artificial scaling) for ratio metrics
-GLOBAL_STATISTICS: Dict[str, FeatureStatistics] = {
+_GLOBAL_STATISTICS: Dict[str, FeatureStatistics] = {
     # Text metrics - ranges set to preserve raw signal integrity
     # For ratios that are already 0-1, we pass through with minimal transformation
     "semantic_relevance_mean": FeatureStatistics(0.4, 0.2, 0.0, 1.0),
@@ -73,6 +100,13 @@ GLOBAL_STATISTICS: Dict[str, FeatureStatistics] = {
     "emotion_mismatch_score": FeatureStatistics(0.1, 0.1, 0.0, 0.5),
 }
 
+# Read-only view of the baselines with interned keys, so lookups with interned
+# feature names hit the identity fast path. Normalizer copies it before applying
+# custom statistics.
+GLOBAL_STATISTICS: Mapping[str, FeatureStatistics] = MappingProxyType(
+    {sys.intern(name): stats for name, stats in _GLOBAL_STATISTICS.items()}
+)
+
 
 class Normalizer:
     """
@@ -84,9 +118,10 @@ class Normalizer:
     def __init__(
         self,
         use_zscore: bool = False,  # Default to min-max for stability
-        clip_range: tuple = (-2.0, 2.0),  # Tighter clipping
-        custom_statistics: Optional[Dict[str, FeatureStatistics]] = None
-    ):
+        clip_range: Tuple[float, float] = (-2.0, 2.0),  # Tighter clipping
+        custom_statistics: Optional[Dict[str, FeatureStatistics]] = None,
+        stride_bytes: int = 1 << 20  # Cache-sized tile for baseline reductions
+    ) -> None:
         """
         Initialize normalizer.
         
@@ -94,13 +129,55 @@ class Normalizer:
             use_zscore: If True, use z-score normalization. Otherwise, min-max.
             clip_range: Range to clip z-scores to prevent extreme values.
             custom_statistics: Optional custom statistics to override globals.
+            stride_bytes: Bytes of float64 values reduced per chunk when
+                computing session baselines from large value lists.
         """
         self.use_zscore = use_zscore
         self.clip_range = clip_range
+        self._baseline_stride = max(1, stride_bytes // _FLOAT64.itemsize)
         self.statistics = {**GLOBAL_STATISTICS}
         
         if custom_statistics:
             self.statistics.update(custom_statistics)
+        
+        self._build_index()
+        
+        # Shared across request threads, so every access holds the lock
+        self._cache: "OrderedDict[Tuple[Tuple[str, type, Any], ...], Dict[str, Any]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+    
+    def _build_index(self) -> None:
+        """
+        Lay out statistics as parallel arrays (struct of arrays) indexed by
+        feature position, for the vectorized kernels. The extra trailing slot
+        holds default statistics for unknown features.
+        """
+        self._feature_order = [sys.intern(name) for name in self.statistics]
+        self._index = {name: i for i, name in enumerate(self._feature_order)}
+        self._default_index = len(self._feature_order)
+        
+        stats = list(self.statistics.values()) + [FeatureStatistics()]
+        self._means = np.array([s.mean for s in stats], dtype=np.float64)
+        self._stds = np.array([s.std for s in stats], dtype=np.float64)
+        self._mins = np.array([s.min_val for s in stats], dtype=np.float64)
+        self._maxes = np.array([s.max_val for s in stats], dtype=np.float64)
+        
+        # Zero-range features get a placeholder range of 1.0 and are overwritten
+        # with 0.5 in one masked assignment after the clip
+        ranges = self._maxes - self._mins
+        self._zero_range = ranges == 0.0
+        self._ranges = np.where(self._zero_range, 1.0, ranges)
+        
+        # Zero-std features likewise divide by 1.0 and are then set to 0.0
+        self._zero_std = self._stds == 0.0
+        self._stds = np.where(self._zero_std, 1.0, self._stds)
+        
+        # Normalized form of a raw 0.0 (the schema default) for each feature
+        normalize = self._zscore_normalize if self.use_zscore else self._minmax_normalize
+        self._zero_normalized = {
+            name: normalize(0.0, stats) for name, stats in self.statistics.items()
+        }
+        self._default_zero_normalized = normalize(0.0, FeatureStatistics())
     
     def normalize_value(
         self,
@@ -119,6 +196,10 @@ class Normalizer:
         Returns:
             Normalized value
         """
+        # Default-valued features need no arithmetic
+        if value == 0.0 and session_baseline is None:
+            return self._zero_normalized.get(feature_name, self._default_zero_normalized)
+        
         # Get statistics (prefer session baseline if provided)
         stats = session_baseline or self.statistics.get(
             feature_name, FeatureStatistics()
@@ -137,30 +218,182 @@ class Normalizer:
         """
         Normalize all metrics in a dictionary.
         
+        All numeric features are normalized in one vectorized pass over the
+        statistics arrays; session baselines are applied as sparse overrides
+        on a per-call copy.
+        
         Args:
             metrics: Dictionary of feature names to raw values
             session_baselines: Optional session-specific baselines
             
         Returns:
-            Dictionary of normalized values
-        """
-        normalized = {}
-        
-        for feature_name, value in metrics.items():
-            if isinstance(value, (int, float)):
-                baseline = None
-                if session_baselines and feature_name in session_baselines:
-                    baseline = session_baselines[feature_name]
-                
-                normalized[feature_name] = self.normalize_value(
-                    feature_name, float(value), baseline
-                )
-            else:
-                # Keep non-numeric values as-is
-                normalized[feature_name] = value
+            Dictionary of normalized values, in the input key order
+        """
+        # Repeated payloads (retries, streaming re-analysis) are served from the
+        # cache. Session baselines change the result, so those calls bypass it.
+        cache_key: Optional[Tuple[Tuple[str, type, Any], ...]] = None
+        if not session_baselines and len(metrics) < _CACHE_MAX_ITEMS:
+            cache_key = self._cache_key(metrics)
+        if cache_key is not None:
+            with self._cache_lock:
+                cached = self._cache.get(cache_key)
+                if cached is not None:
+                    self._cache.move_to_end(cache_key)
+            if cached is not None:
+                return dict(cached)
+        
+        # Non-numeric values are kept as-is; numeric ones are overwritten below
+        normalized = dict(metrics)
+        
+        names = self._numeric_names(metrics)
+        if names:
+            values = [metrics[name] for name in names]
+            normalized.update(zip(names, self._normalize_batch(names, values, session_baselines)))
         
+        if cache_key is not None:
+            with self._cache_lock:
+                self._cache[cache_key] = dict(normalized)
+                if len(self._cache) > _CACHE_SIZE:
+                    self._cache.popitem(last=False)
         return normalized
     
+    @staticmethod
+    def _cache_key(metrics: Dict[str, Any]) -> Optional[Tuple[Tuple[str, type, Any], ...]]:
+        """
+        Result cache key for metrics, or None when they cannot be cached.
+        
+        Each value's type is part of the key, since 1, 1.0, True and
+        np.float64(1.0) are equal and hash alike but are not interchangeable.
+        Only plain scalar types are accepted, so the key is always hashable.
+        The key keeps insertion order, so a hit also has the right key order.
+        """
+        items: List[Tuple[str, type, Any]] = []
+        for name, value in metrics.items():
+            value_type = type(value)
+            if value_type not in _CACHEABLE_TYPES:
+                return None
+            items.append((name, value_type, value))
+        return tuple(items)
+    
+    def _numeric_names(self, metrics: Dict[str, Any]) -> List[str]:
+        """
+        Names of the numeric features in metrics. Known features come first, in
+        statistics order, so the kernels read the statistics arrays
+        sequentially; unknown features follow in key order.
+        """
+        # Known names are the interned statistics keys themselves, so the
+        # kernels' index lookups match them by identity; the incoming keys
+        # need no interning
+        names = [
+            name for name in self._feature_order
+            if isinstance(metrics.get(name), (int, float))
+        ]
+        
+        # Only scan the keys again when some of them were not matched above
+        if len(names) < len(metrics):
+            index = self._index
+            names.extend(
+                name for name, value in metrics.items()
+                if name not in index and isinstance(value, (int, float))
+            )
+        return names
+    
+    def _normalize_batch(
+        self,
+        names: List[str],
+        values: List[Any],
+        session_baselines: Optional[Dict[str, FeatureStatistics]]
+    ) -> List[float]:
+        """Normalize parallel lists of feature names and raw values in one kernel call."""
+        n = len(names)
+        raw = _np_fromiter((float(value) for value in values), dtype=_FLOAT64, count=n)
+        
+        # All-default input, such as the zeroed metrics of a modality that
+        # failed: read the precomputed normalized zeros instead of the kernel
+        if not session_baselines and not raw.any():
+            zero = self._zero_normalized
+            default = self._default_zero_normalized
+            return [zero.get(name, default) for name in names]
+        
+        idx = _np_fromiter(
+            (self._index.get(name, self._default_index) for name in names),
+            dtype=_INTP,
+            count=n
+        )
+        
+        if self.use_zscore:
+            out = self._zscore_kernel(raw, idx, names, session_baselines)
+        else:
+            out = self._minmax_kernel(raw, idx, names, session_baselines)
+        
+        result: List[float] = out.tolist()
+        return result
+    
+    def _minmax_kernel(
+        self,
+        raw: np.ndarray,
+        idx: np.ndarray,
+        names: List[str],
+        session_baselines: Optional[Dict[str, FeatureStatistics]]
+    ) -> np.ndarray:
+        """Min-max normalize raw (in place) against the statistics rows idx."""
+        # Fancy indexing copies, so session overrides never touch the globals
+        mins = self._mins[idx]
+        ranges = self._ranges[idx]
+        zero_range = self._zero_range[idx]
+        
+        if session_baselines:
+            for i, name in enumerate(names):
+                baseline = session_baselines.get(name)
+                if baseline is not None:
+                    mins[i] = baseline.min_val
+                    ranges[i] = baseline.max_val - baseline.min_val
+                    zero_range[i] = False
+            
+            # Zero ranges among the overrides are masked in one pass
+            zero_range |= ranges == 0.0
+            ranges[zero_range] = 1.0
+        
+        out = raw
+        _np_subtract(out, mins, out=out)
+        _np_divide(out, ranges, out=out)
+        _np_clip(out, 0.0, 1.0, out=out)
+        out[zero_range] = 0.5
+        return out
+    
+    def _zscore_kernel(
+        self,
+        raw: np.ndarray,
+        idx: np.ndarray,
+        names: List[str],
+        session_baselines: Optional[Dict[str, FeatureStatistics]]
+    ) -> np.ndarray:
+        """Z-score normalize raw (in place), clip, and scale to [0, 1]."""
+        means = self._means[idx]
+        stds = self._stds[idx]
+        zero_std = self._zero_std[idx]
+        
+        if session_baselines:
+            for i, name in enumerate(names):
+                baseline = session_baselines.get(name)
+                if baseline is not None:
+                    means[i] = baseline.mean
+                    stds[i] = baseline.std
+                    zero_std[i] = False
+            
+            zero_std |= stds == 0.0
+            stds[zero_std] = 1.0
+        
+        low, high = self.clip_range
+        out = raw
+        _np_subtract(out, means, out=out)
+        _np_divide(out, stds, out=out)
+        _np_clip(out, low, high, out=out)
+        _np_subtract(out, low, out=out)
+        _np_divide(out, high - low, out=out)
+        out[zero_std] = 0.0
+        return out
+    
     def normalize_all(
         self,
         text_metrics: Dict[str, Any],
@@ -180,10 +413,73 @@ class Normalizer:
         Returns:
             Dictionary with normalized text, audio, and video metrics
         """
+        # All three modalities go through a single kernel call; each one owns
+        # a contiguous slice of the concatenated batch
+        groups = {
+            "text_metrics": text_metrics,
+            "audio_metrics": audio_metrics,
+            "video_metrics": video_metrics
+        }
+        group_names = {key: self._numeric_names(metrics) for key, metrics in groups.items()}
+        
+        names: List[str] = []
+        values: List[Any] = []
+        for key, metrics in groups.items():
+            names.extend(group_names[key])
+            values.extend(metrics[name] for name in group_names[key])
+        
+        out = self._normalize_batch(names, values, session_baselines) if names else []
+        
+        result: Dict[str, Dict[str, float]] = {}
+        start = 0
+        for key, metrics in groups.items():
+            stop = start + len(group_names[key])
+            normalized = dict(metrics)
+            normalized.update(zip(group_names[key], out[start:stop]))
+            result[key] = normalized
+            start = stop
+        return result
+    
+    async def normalize_all_async(
+        self,
+        text_metrics: Dict[str, Any],
+        audio_metrics: Dict[str, Any],
+        video_metrics: Dict[str, Any],
+        session_baselines: Optional[Dict[str, FeatureStatistics]] = None
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Normalize all perception metrics, one worker thread per modality.
+        
+        NumPy releases the GIL inside the kernels, so the three passes can
+        overlap on multi-core hosts. Each thread dispatch costs on the order
+        of 10 microseconds, so this only pays off for large metric dicts; the
+        batched normalize_all is the better choice otherwise. Empty modalities
+        are returned without dispatching a thread.
+        
+        Args:
+            text_metrics: Raw text metrics
+            audio_metrics: Raw audio metrics
+            video_metrics: Raw video metrics
+            session_baselines: Optional session-specific baselines
+            
+        Returns:
+            Dictionary with normalized text, audio, and video metrics
+        """
+        async def normalize(metrics: Dict[str, Any]) -> Dict[str, float]:
+            if not metrics:
+                return {}
+            return await asyncio.to_thread(self.normalize_metrics, metrics, session_baselines)
+        
+        # gather's fixed-arity overloads are typed as returning a tuple, but
+        # it returns a list, which mypyc-compiled code rejects. The star-args
+        # form is typed as a list, so index it instead of unpacking.
+        results = await asyncio.gather(
+            *(normalize(metrics) for metrics in (text_metrics, audio_metrics, video_metrics))
+        )
         return {
-            "text_metrics": self.normalize_metrics(text_metrics, session_baselines),
-            "audio_metrics": self.normalize_metrics(audio_metrics, session_baselines),
-            "video_metrics": self.normalize_metrics(video_metrics, session_baselines)
+            "text_metrics": results[0],
+            "audio_metrics": results[1],
+            "video_metrics": results[2]
         }
     
     def _zscore_normalize(self, value: float, stats: FeatureStatistics) -> float:
@@ -193,13 +489,13 @@ class Normalizer:
         
         z_score = (value - stats.mean) / stats.std
         
-        # Clip to prevent extreme values
-        clipped = np.clip(z_score, self.clip_range[0], self.clip_range[1])
+        # Clip to prevent extreme values (plain comparisons; a ufunc call
+        # costs far more than the arithmetic for a single scalar)
+        low, high = self.clip_range
+        clipped = low if z_score < low else (high if z_score > high else z_score)
         
         # Scale to [0, 1] range
-        normalized = (clipped - self.clip_range[0]) / (
-            self.clip_range[1] - self.clip_range[0]
-        )
+        normalized = (clipped - low) / (high - low)
         
         return float(normalized)
     
@@ -213,7 +509,7 @@ class Normalizer:
         normalized = (value - stats.min_val) / range_val
         
         # Clip to [0, 1]
-        return float(np.clip(normalized, 0.0, 1.0))
+        return float(0.0 if normalized < 0.0 else (1.0 if normalized > 1.0 else normalized))
     
     def get_feature_statistics(self, feature_name: str) -> Optional[FeatureStatistics]:
         """Get predefined statistics for a feature."""
@@ -222,25 +518,57 @@ class Normalizer:
     def update_session_baseline(
         self,
         feature_name: str,
-        values: list,
+        values: Union[Sequence[float], np.ndarray],
         session_baselines: Dict[str, FeatureStatistics]
-    ):
+    ) -> None:
         """
         Calculate session-specific baseline from initial values.
         Call this at session start, not during inference.
         
         Args:
             feature_name: Name of the feature
-            values: List of initial values to compute baseline from
+            values: Initial values to compute baseline from (list or 1-D array)
             session_baselines: Dictionary to update with new baseline
         """
-        if not values:
+        n = len(values)
+        if n == 0:
             return
         
-        values_array = np.array(values)
+        # Sums are taken about the first value (shifted data) so the
+        # sum-of-squares variance does not lose precision to a large mean
+        shift = float(values[0])
+        
+        if n < _SMALL_BASELINE_SIZE:
+            total = total_sq = 0.0
+            min_val = max_val = shift
+            for value in values:
+                value = float(value)
+                d = value - shift
+                total += d
+                total_sq += d * d
+                if value < min_val:
+                    min_val = value
+                elif value > max_val:
+                    max_val = value
+        else:
+            # Reduce in cache-sized chunks, so each chunk's conversion and its
+            # four reductions stay in cache instead of streaming the whole array
+            total = total_sq = 0.0
+            min_val = max_val = shift
+            stride = self._baseline_stride
+            for i in range(0, n, stride):
+                chunk = _np_asarray(values[i:i + stride], dtype=_FLOAT64)
+                deltas = chunk - shift
+                total += float(deltas.sum())
+                total_sq += float(deltas @ deltas)
+                min_val = min(min_val, float(chunk.min()))
+                max_val = max(max_val, float(chunk.max()))
+        
+        mean_d = total / n
+        variance = total_sq / n - mean_d * mean_d
         session_baselines[feature_name] = FeatureStatistics(
-            mean=float(np.mean(values_array)),
-            std=float(np.std(values_array)) or 1.0,
-            min_val=float(np.min(values_array)),
-            max_val=float(np.max(values_array))
+            mean=shift + mean_d,
+            std=_sqrt(variance) if variance > 0.0 else 1.0,
+            min_val=min_val,
+            max_val=max_val
         )
@@ -0,0 +1,4 @@
+"""
+Pytest root for the perception service: puts this directory on sys.path so
+tests import the service as the `app` package, as the server does.
+"""
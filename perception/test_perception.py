@@ -2,20 +2,23 @@
 Test script to verify the perception layer is working correctly.
 """
 
-import requests
-import json
+import httpx
+import orjson
 import base64
 
 # Perception layer URL
 BASE_URL = "http://localhost:8000"
 
+# One keep-alive connection pool shared by every test
+SESSION = httpx.Client(base_url=BASE_URL, timeout=30.0)
+
 def test_health():
     """Test health endpoint."""
     print("Testing health endpoint...")
     try:
-        response = requests.get(f"{BASE_URL}/health")
+        response = SESSION.get("/health")
         print(f"Status: {response.status_code}")
-        print(f"Response: {json.dumps(response.json(), indent=2)}")
+        print(f"Response: {orjson.dumps(orjson.loads(response.content), option=orjson.OPT_INDENT_2).decode()}")
         return response.status_code == 200
     except Exception as e:
         print(f"Error: {e}")
@@ -25,9 +28,9 @@ def test_analyze_get():
     """Test GET /analyze endpoint (should return schema info)."""
     print("\nTesting GET /analyze endpoint...")
     try:
-        response = requests.get(f"{BASE_URL}/analyze")
+        response = SESSION.get("/analyze")
         print(f"Status: {response.status_code}")
-        data = response.json()
+        data = orjson.loads(response.content)
         print(f"Status: {data.get('status')}")
         print(f"Message: {data.get('message')}")
         return response.status_code == 200
@@ -53,11 +56,11 @@ def test_text_analysis():
             "response_durations": [12.5, 15.0, 10.5]
         }
         
-        response = requests.post(f"{BASE_URL}/analyze/text", json=payload)
+        response = SESSION.post("/analyze/text", json=payload)
         print(f"Status: {response.status_code}")
         
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             print(f"Processing time: {data.get('processing_time_ms', 0):.2f}ms")
             
             # Show sample metrics
@@ -81,9 +84,9 @@ def test_root():
     """Test root endpoint."""
     print("\nTesting root endpoint...")
     try:
-        response = requests.get(f"{BASE_URL}/")
+        response = SESSION.get("/")
         print(f"Status: {response.status_code}")
-        data = response.json()
+        data = orjson.loads(response.content)
         print(f"Service: {data.get('service')}")
         print(f"Version: {data.get('version')}")
         print(f"Available endpoints: {list(data.get('endpoints', {}).keys())}")
@@ -98,12 +101,15 @@ def main():
     print("AURA Perception Layer - Test Suite")
     print("=" * 60)
     
-    results = {
-        "Root endpoint": test_root(),
-        "Health check": test_health(),
-        "GET /analyze": test_analyze_get(),
-        "Text analysis": test_text_analysis()
-    }
+    try:
+        results = {
+            "Root endpoint": test_root(),
+            "Health check": test_health(),
+            "GET /analyze": test_analyze_get(),
+            "Text analysis": test_text_analysis()
+        }
+    finally:
+        SESSION.close()
     
     print("\n" + "=" * 60)
     print("Test Results Summary")
@@ -0,0 +1,100 @@
+"""
+Tests for the analysis routes module.
+"""
+
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("sentence_transformers")
+pytest.importorskip("librosa")
+
+from fastapi import FastAPI, HTTPException  # noqa: E402
+
+from app.routes import analyze  # noqa: E402
+from app.schemas import (  # noqa: E402
+    AnalyzeRequest,
+    AudioInput,
+    ImageInput,
+    TextInput,
+    VideoInput
+)
+
+
+@pytest.fixture
+def broken_pool(monkeypatch):
+    """Install a one-process video pool in place of the module's pool."""
+    executor = ProcessPoolExecutor(max_workers=1)
+    monkeypatch.setattr(analyze, "video_executor", executor)
+    yield executor
+    analyze.video_executor.shutdown(cancel_futures=True)
+    executor.shutdown(cancel_futures=True)
+
+
+def test_broken_video_pool_is_replaced(broken_pool):
+    # A worker exiting mid-task breaks the pool
+    with pytest.raises(HTTPException) as excinfo:
+        asyncio.run(analyze._run_in_video_pool(os._exit, 1))
+    
+    assert excinfo.value.status_code == 503
+    assert analyze.video_executor is not broken_pool
+    assert asyncio.run(analyze._run_in_video_pool(abs, -3)) == 3
+
+
+@pytest.fixture(scope="module")
+def openapi_schema():
+    app = FastAPI()
+    app.include_router(analyze.router)
+    app.include_router(analyze.internal_router)
+    return app.openapi()
+
+
+@pytest.mark.parametrize("path, model", [
+    ("/analyze", AnalyzeRequest),
+    ("/internal/analyze", AnalyzeRequest),
+    ("/analyze/text", TextInput),
+    ("/analyze/audio", AudioInput),
+    ("/analyze/video", VideoInput),
+    ("/analyze/image", ImageInput),
+])
+def test_request_body_schema_is_documented(openapi_schema, path, model):
+    body = openapi_schema["paths"][path]["post"]["requestBody"]
+    schema = body["content"]["application/json"]["schema"]
+    
+    assert body["required"] is True
+    assert schema["title"] == model.__name__
+    assert set(schema["properties"]) == set(model.model_fields)
+    assert "$ref" not in str(schema)
+
+
+def test_nested_request_models_are_inlined(openapi_schema):
+    body = openapi_schema["paths"]["/analyze"]["post"]["requestBody"]
+    text = body["content"]["application/json"]["schema"]["properties"]["text"]
+    
+    text_schema = next(option for option in text["anyOf"] if option.get("type") == "object")
+    assert text_schema["required"] == ["user_responses"]
+
+
+async def _result(metrics):
+    return metrics
+
+
+@pytest.mark.parametrize("concurrent", [False, True])
+def test_run_analysis_normalizes_each_modality(monkeypatch, concurrent):
+    monkeypatch.setattr(analyze.settings, "concurrent_normalization", concurrent)
+    text = {"semantic_relevance_mean": 0.62, "hedge_ratio": 0.04}
+    video = {"eye_contact_ratio": 0.7, "gaze_variance": 0.2}
+    
+    async def run():
+        tasks = {"text": _result(text), "video": _result(video)}
+        return await analyze._run_analysis(tasks, normalize=True, include_raw=True, start_time=0.0)
+    
+    response = asyncio.run(run())
+    
+    assert response["text_metrics"] == analyze.normalizer.normalize_metrics(text)
+    assert response["video_metrics"] == analyze.normalizer.normalize_metrics(video)
+    assert response["audio_metrics"] is None
+    assert response["raw_metrics"]["text_metrics"] == text
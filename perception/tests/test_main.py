@@ -0,0 +1,38 @@
+"""
+Tests for the FastAPI application setup.
+"""
+
+import importlib
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("sentence_transformers")
+pytest.importorskip("librosa")
+
+from app.config import Settings, settings  # noqa: E402
+
+
+def _build_app(monkeypatch, enable_internal_routes):
+    """Re-import app.main with the given settings, returning its app."""
+    monkeypatch.setattr(settings, "enable_internal_routes", enable_internal_routes)
+    import app.main
+    return importlib.reload(app.main).app
+
+
+def _paths(app):
+    return {route.path for route in app.routes}
+
+
+def test_internal_routes_are_off_by_default(monkeypatch):
+    assert Settings.model_fields["enable_internal_routes"].default is False
+    app = _build_app(monkeypatch, False)
+    
+    assert "/analyze" in _paths(app)
+    assert "/internal/analyze" not in _paths(app)
+
+
+def test_internal_routes_can_be_enabled(monkeypatch):
+    app = _build_app(monkeypatch, True)
+    
+    assert "/internal/analyze" in _paths(app)
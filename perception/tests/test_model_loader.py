@@ -0,0 +1,57 @@
+"""
+Tests for the model registry.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pytest.importorskip("torch")
+pytest.importorskip("sentence_transformers")
+pytest.importorskip("transformers")
+
+from app.models.loader import get_model_registry  # noqa: E402
+
+
+class ExclusiveModel:
+    """Fake model that records whether two threads ever called it at once."""
+    
+    def __init__(self):
+        self._active = 0
+        self._guard = threading.Lock()
+        self.overlapped = False
+    
+    def _enter(self):
+        with self._guard:
+            self._active += 1
+            self.overlapped |= self._active > 1
+        time.sleep(0.01)
+        with self._guard:
+            self._active -= 1
+    
+    def __call__(self, text):
+        self._enter()
+        return [[{"label": "neutral", "score": 1.0}]]
+    
+    def encode(self, texts, convert_to_numpy=True):
+        self._enter()
+        return texts
+
+
+@pytest.mark.parametrize("attribute, method, arg", [
+    ("sentence_transformer", "get_embeddings_batch", ["a", "b"]),
+    ("sentence_transformer", "get_embedding", "a"),
+    ("emotion_classifier", "get_emotions", "a"),
+    ("sentiment_classifier", "get_sentiment", "a"),
+])
+def test_models_are_called_by_one_thread_at_a_time(monkeypatch, attribute, method, arg):
+    registry = get_model_registry()
+    model = ExclusiveModel()
+    monkeypatch.setattr(registry, attribute, model)
+    
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(lambda _: getattr(registry, method)(arg), range(8)))
+    
+    assert not model.overlapped
@@ -0,0 +1,103 @@
+"""
+Tests for the feature normalizer.
+"""
+
+import asyncio
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from app.utils.normalization import Normalizer
+
+
+TEXT_METRICS = {"semantic_relevance_mean": 0.62, "hedge_ratio": 0.04, "negative_spike_count": 2}
+AUDIO_METRICS = {"speech_rate_wpm": 151.0, "silence_ratio": 0.3}
+VIDEO_METRICS = {"eye_contact_ratio": 0.7, "gaze_variance": 0.2}
+
+
+@pytest.fixture
+def normalizer():
+    return Normalizer()
+
+
+def test_normalize_all_async_matches_normalize_all(normalizer):
+    expected = normalizer.normalize_all(TEXT_METRICS, AUDIO_METRICS, VIDEO_METRICS)
+    result = asyncio.run(
+        normalizer.normalize_all_async(TEXT_METRICS, AUDIO_METRICS, VIDEO_METRICS)
+    )
+    
+    assert result == expected
+
+
+def test_normalize_all_async_skips_empty_modalities(normalizer):
+    result = asyncio.run(normalizer.normalize_all_async(TEXT_METRICS, {}, {}))
+    
+    assert result["audio_metrics"] == {}
+    assert result["video_metrics"] == {}
+    assert result["text_metrics"] == normalizer.normalize_metrics(TEXT_METRICS)
+
+
+@pytest.mark.parametrize("size", [10, 1000])
+def test_update_session_baseline_accepts_arrays(normalizer, size):
+    values = np.linspace(100.0, 200.0, size)
+    from_list, from_array = {}, {}
+    
+    normalizer.update_session_baseline("pitch_mean", values.tolist(), from_list)
+    normalizer.update_session_baseline("pitch_mean", values, from_array)
+    
+    stats = from_array["pitch_mean"]
+    assert stats == from_list["pitch_mean"]
+    assert stats.mean == pytest.approx(values.mean())
+    assert stats.std == pytest.approx(values.std())
+    assert (stats.min_val, stats.max_val) == (100.0, 200.0)
+
+
+def test_update_session_baseline_ignores_empty_input(normalizer):
+    baselines = {}
+    
+    normalizer.update_session_baseline("pitch_mean", np.array([]), baselines)
+    
+    assert baselines == {}
+
+
+def test_repeated_metrics_are_served_from_cache(normalizer):
+    first = normalizer.normalize_metrics(TEXT_METRICS)
+    second = normalizer.normalize_metrics(dict(TEXT_METRICS))
+    
+    assert second == first
+    assert second is not first
+    assert len(normalizer._cache) == 1
+
+
+def test_cache_keeps_equal_values_of_different_types_apart(normalizer):
+    # 1 == Decimal(1) with equal hashes, but only the int is a numeric feature
+    normalized = normalizer.normalize_metrics({"hedge_ratio": 0.04, "note": 1})
+    passed_through = normalizer.normalize_metrics({"hedge_ratio": 0.04, "note": Decimal(1)})
+    
+    assert isinstance(normalized["note"], float)
+    assert passed_through["note"] == Decimal(1)
+    assert isinstance(passed_through["note"], Decimal)
+
+
+@pytest.mark.parametrize("value", [["a", "b"], {"a": 1}, np.float64(0.04)])
+def test_non_scalar_values_bypass_cache(normalizer, value):
+    metrics = {"hedge_ratio": 0.04, "extra": value}
+    
+    result = normalizer.normalize_metrics(metrics)
+    
+    assert result == normalizer.normalize_metrics(metrics)
+    assert len(normalizer._cache) == 0
+
+
+@pytest.mark.parametrize("use_zscore", [False, True])
+def test_all_zero_metrics_match_the_kernel(use_zscore):
+    normalizer = Normalizer(use_zscore=use_zscore)
+    zeros = {name: 0.0 for name in [*TEXT_METRICS, *AUDIO_METRICS, "unknown_metric"]}
+    # One tiny non-zero value sends the same features through the kernel
+    nearly_zeros = {**zeros, "unknown_metric": 1e-300}
+    
+    result = normalizer.normalize_metrics(zeros)
+    
+    assert result == pytest.approx(normalizer.normalize_metrics(nearly_zeros))
+    assert result == normalizer.normalize_all(zeros, {}, {})["text_metrics"]
@@ -0,0 +1,79 @@
+"""
+Regression tests: downscaling frames before detection must not change the
+pixel-space body language metrics, which are calibrated for the source size.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+pytest.importorskip("cv2")
+
+from app.perception.video_perception import VideoPerception  # noqa: E402
+
+
+N_FRAMES = 12
+N_POSE_LANDMARKS = 33
+
+
+class ScriptedPose:
+    """Stands in for MediaPipe Pose, replaying a fixed normalized-landmark clip."""
+    
+    def __init__(self):
+        self.calls = 0
+    
+    def process(self, rgb_frame):
+        t = self.calls
+        self.calls += 1
+        
+        points = np.full((N_POSE_LANDMARKS, 3), 0.5)
+        points[VideoPerception.POSE_NOSE] = (0.5, 0.40, -0.10)
+        points[VideoPerception.POSE_LEFT_SHOULDER] = (0.40, 0.55, 0.0)
+        points[VideoPerception.POSE_RIGHT_SHOULDER] = (0.60, 0.55, 0.0)
+        points[VideoPerception.POSE_LEFT_HIP] = (0.42, 0.90, 0.0)
+        points[VideoPerception.POSE_RIGHT_HIP] = (0.58, 0.90, 0.0)
+        points[VideoPerception.POSE_LEFT_ELBOW] = (0.35, 0.70, 0.0)
+        points[VideoPerception.POSE_RIGHT_ELBOW] = (0.65, 0.70, 0.0)
+        # Hands alternate between small and large moves, and between face and lap height
+        points[VideoPerception.POSE_LEFT_WRIST] = (0.30 + 0.015 * (t % 2) + 0.05 * (t % 3 == 0), 0.45 if t % 4 else 0.85, 0.0)
+        points[VideoPerception.POSE_RIGHT_WRIST] = (0.70 - 0.01 * (t % 2), 0.80, 0.0)
+        
+        landmarks = [SimpleNamespace(x=x, y=y, z=z) for x, y, z in points]
+        return SimpleNamespace(pose_landmarks=SimpleNamespace(landmark=landmarks))
+    
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def perception():
+    vp = VideoPerception()
+    yield vp
+    vp.close()
+
+
+def _body_metrics(vp, width, height, max_frame_side):
+    """Run the scripted clip at the given source size and analysis size cap."""
+    vp.MAX_FRAME_SIDE = max_frame_side
+    vp._frame_plan_cache.clear()
+    vp.pose = ScriptedPose()
+    if vp._pose_executor is None:
+        vp._pose_executor = ThreadPoolExecutor(max_workers=1)
+    
+    frames = [np.zeros((height, width, 3), dtype=np.uint8) for _ in range(N_FRAMES)]
+    metrics = vp.extract_metrics_from_frames(frames, fps=10.0).to_dict()
+    return {
+        name: metrics[name]
+        for name in ("gesture_frequency", "gesture_amplitude", "hand_to_face_ratio")
+    }
+
+
+@pytest.mark.parametrize("width, height", [(854, 480), (1920, 1080)])
+def test_downscaling_keeps_body_metrics(perception, width, height):
+    full_resolution = _body_metrics(perception, width, height, max_frame_side=10_000)
+    downscaled = _body_metrics(perception, width, height, max_frame_side=480)
+    
+    assert full_resolution["gesture_frequency"] > 0
+    assert downscaled == pytest.approx(full_resolution)
@@ -0,0 +1,105 @@
+"""
+Regression tests: sampling a video below its frame rate must not change the
+motion metrics, whose thresholds are calibrated on consecutive 30 FPS frames.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+pytest.importorskip("cv2")
+
+from app.perception.video_perception import VideoPerception  # noqa: E402
+
+
+SOURCE_FPS = 30.0
+N_FRAMES = 180
+# Wide and short: wrist motion is measured in source pixels across the width
+FRAME_WIDTH, FRAME_HEIGHT = 1280, 24
+
+# Each second: 0.6 s of slow drift (below the thresholds), then 0.4 s of a fast move
+DRIFT_SECONDS = 0.6
+YAW_DRIFT, YAW_TURN = 30.0, 400.0        # degrees per second
+WRIST_DRIFT, WRIST_MOVE = 0.1, 1.0       # frame widths per second
+
+
+def _position(t, drift_speed, move_speed):
+    """Piecewise-linear track, reversing direction every second."""
+    position = 0.0
+    for second in range(int(t) + 1):
+        span = min(t - second, 1.0)
+        direction = 1 if second % 2 == 0 else -1
+        drift = min(span, DRIFT_SECONDS)
+        position += direction * (drift * drift_speed + max(span - DRIFT_SECONDS, 0.0) * move_speed)
+    return position
+
+
+def _frame_index(rgb_frame):
+    return int(rgb_frame[0, 0, 0]) + 256 * int(rgb_frame[0, 1, 0])
+
+
+class ScriptedPose:
+    """Stands in for MediaPipe Pose, moving the left wrist along the scripted track."""
+    
+    def process(self, rgb_frame):
+        t = _frame_index(rgb_frame) / SOURCE_FPS
+        points = np.full((33, 3), 0.5)
+        points[VideoPerception.POSE_LEFT_WRIST, 0] = 0.3 + _position(t, WRIST_DRIFT, WRIST_MOVE)
+        landmarks = [SimpleNamespace(x=x, y=y, z=z) for x, y, z in points]
+        return SimpleNamespace(pose_landmarks=SimpleNamespace(landmark=landmarks))
+    
+    def close(self):
+        pass
+
+
+class ScriptedFaceMesh:
+    """Stands in for Face Mesh; the first landmark carries the frame index."""
+    
+    def process(self, rgb_frame):
+        points = [SimpleNamespace(x=0.5, y=0.5, z=0.0) for _ in range(468)]
+        points[0] = SimpleNamespace(x=float(_frame_index(rgb_frame)), y=0.5, z=0.0)
+        return SimpleNamespace(multi_face_landmarks=[SimpleNamespace(landmark=points)])
+    
+    def close(self):
+        pass
+
+
+def _scripted_head_pose(landmarks, plan):
+    t = landmarks[0, 0] / SOURCE_FPS
+    return (_position(t, YAW_DRIFT, YAW_TURN) - 80.0, 0.0, 0.0)
+
+
+@pytest.fixture
+def perception(monkeypatch):
+    vp = VideoPerception()
+    vp.MAX_FRAME_SIDE = 10_000  # keep the index pixels intact
+    vp.pose = ScriptedPose()
+    vp.face_mesh = ScriptedFaceMesh()
+    vp.face_landmarker = None
+    vp._has_face_tracker = True
+    if vp._pose_executor is None:
+        vp._pose_executor = ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(vp, "_estimate_head_pose", _scripted_head_pose)
+    
+    frames = []
+    for index in range(N_FRAMES):
+        frame = np.zeros((FRAME_HEIGHT, FRAME_WIDTH, 3), dtype=np.uint8)
+        frame[0, 0] = index % 256
+        frame[0, 1] = index // 256
+        frames.append(frame)
+    monkeypatch.setattr(vp, "_iter_video_frames", lambda data, stride=1: iter(frames[::stride]))
+    
+    yield vp
+    vp.close()
+
+
+def test_sampled_motion_metrics_match_every_frame(perception):
+    every_frame = perception.extract_metrics(b"", fps=SOURCE_FPS, target_fps=None).to_dict()
+    sampled = perception.extract_metrics(b"", fps=SOURCE_FPS, target_fps=5.0).to_dict()
+    
+    for name in ("head_turn_frequency", "gesture_frequency", "gesture_amplitude"):
+        assert every_frame[name] > 0, name
+        assert sampled[name] == pytest.approx(every_frame[name], rel=0.1), name
+    assert every_frame["gesture_amplitude"] < 1.0
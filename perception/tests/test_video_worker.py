@@ -0,0 +1,44 @@
+"""
+Tests for the video worker process entry points.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from app.perception import video_worker
+
+
+SERVICE_ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_worker_import_skips_text_and_audio_stacks():
+    # Run in a fresh interpreter, like a spawned worker, so other tests'
+    # imports do not leak into sys.modules
+    code = (
+        "import sys\n"
+        "import app.perception.video_worker\n"
+        "loaded = [m for m in ('app.perception.text_perception',\n"
+        "                      'app.perception.audio_perception',\n"
+        "                      'torch', 'transformers') if m in sys.modules]\n"
+        "assert not loaded, loaded\n"
+    )
+    subprocess.run([sys.executable, "-c", code], cwd=SERVICE_ROOT, check=True)
+
+
+@pytest.mark.parametrize("web_workers, expected", [(1, 8), (4, 2), (3, 2), (16, 1)])
+def test_default_pool_size_splits_cpus_across_web_workers(monkeypatch, web_workers, expected):
+    monkeypatch.setattr(video_worker.os, "cpu_count", lambda: 8)
+    
+    assert video_worker.default_pool_size(web_workers) == expected
+
+
+def test_explicit_pool_size_wins(monkeypatch):
+    monkeypatch.setattr(video_worker.os, "cpu_count", lambda: 8)
+    executor = video_worker.create_video_executor(max_workers=3, web_workers=4)
+    try:
+        assert executor._max_workers == 3
+    finally:
+        executor.shutdown()